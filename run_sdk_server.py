@@ -11,6 +11,8 @@ import logging
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from src.utils.event_loop import UVICORN_LOOP
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -45,7 +47,13 @@ def main():
         port=port,
         reload=True,
         log_level="info",
+        loop=UVICORN_LOOP,  # uvloop everywhere but Windows, see src/utils/event_loop.py
+        http="auto",  # httptools when installed (uvicorn[standard]), h11 otherwise
         # WebSocket settings
+        # AIDEV-NOTE: Frames are short JSON updates; per-message deflate costs CPU and latency
+        # on every frame for little size benefit
+        ws="websockets",
+        ws_per_message_deflate=False,
         ws_ping_interval=20,
         ws_ping_timeout=10
     )
@@ -7,18 +7,30 @@
 import os
 import logging
 from typing import Dict, Any
-from openai import AsyncAzureOpenAI
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+from src.agents.openai_client import get_client, create_completion
 from src.models.search import AnalysisCache
 from prompts import BIOANALYSER_PROMPT
 from src.utils.raw_logger import log_method_call, log_method_result, log_openai_request, log_openai_response
 
 logger = logging.getLogger(__name__)
 
+# AIDEV-NOTE: Each header ends at its first colon and none is a prefix of another, so a line's
+# header is simply the text before ":" (MISSING_INFO is kept for older prompt outputs)
+_LINE_PREFIXES = ("QUERY_SATISFIED:", "ANALYSIS:", "CRITICAL_MISSING_INFO:", "MISSING_INFO:")
+_PREFIX_FIELDS = {
+    "ANALYSIS": "analysis",
+    "CRITICAL_MISSING_INFO": "missing_info",
+    "MISSING_INFO": "missing_info",
+}
+
+# Shared by every call - never modify in place
+_SYSTEM_MESSAGE = {"role": "system", "content": BIOANALYSER_PROMPT}
+
 class BioAnalyser:
     """Agent that analyzes search results and determines satisfaction"""
     
@@ -34,11 +46,7 @@ class BioAnalyser:
             raise RuntimeError("AZURE_OPENAI_API_KEY environment variable is required for BioAnalyser.")
         if not deployment:
             raise RuntimeError("AZURE_OPENAI_GPT4O_DEPLOYMENT_NAME environment variable is required for BioAnalyser.")
-        self.client = AsyncAzureOpenAI(
-            azure_endpoint=endpoint,
-            api_key=api_key,
-            api_version="2025-01-01-preview"
-        )
+        self.client = get_client()
         self.deployment = deployment
     
     async def analyze(self, query: str, research_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -46,33 +54,34 @@ class BioAnalyser:
         # Log method call
         log_method_call("BioAnalyser", "analyze", {
             "query": query,
-            "papers_count": len(research_data.get("papers", []))
+            "papers_count": len(research_data["papers"])
         })
         
         # Use comprehensive researcher output if available, otherwise fall back to paper summary
-        if research_data.get("researcher_output"):
+        if research_data["researcher_output"]:
             research_content = research_data["researcher_output"]
             content_type = "Comprehensive Research Dump"
         else:
-            research_content = self._summarize_papers(research_data.get("papers", []))
+            research_content = self._summarize_papers(research_data["papers"])
             content_type = "Paper Summary"
         
         # Log OpenAI request
         messages = [
-            {"role": "system", "content": BIOANALYSER_PROMPT},
+            _SYSTEM_MESSAGE,
             {"role": "user", "content": f"""
 User Query: {query}
 
 {content_type}:
 {research_content}
 
-Total papers found: {len(research_data.get('papers', []))}
+Total papers found: {len(research_data['papers'])}
 
 Analyze if this comprehensive research satisfies the query. Follow the output format specified."""}
         ]
         log_openai_request("BioAnalyser", self.deployment, messages)
         
-        response = await self.client.chat.completions.create(
+        response = await create_completion(
+            self.client,
             model=self.deployment,
             messages=messages,
             temperature=1.0,  # Use default temperature
@@ -93,14 +102,14 @@ Analyze if this comprehensive research satisfies the query. Follow the output fo
         }
         
         for line in lines:
-            if line.startswith("QUERY_SATISFIED:"):
-                result["satisfied"] = "YES" in line
-            elif line.startswith("ANALYSIS:"):
-                result["analysis"] = line.replace("ANALYSIS:", "").strip()
-            elif line.startswith("CRITICAL_MISSING_INFO:"):
-                result["missing_info"] = line.replace("CRITICAL_MISSING_INFO:", "").strip()
-            elif line.startswith("MISSING_INFO:"):  # Keep backward compatibility
-                result["missing_info"] = line.replace("MISSING_INFO:", "").strip()
+            # Single tuple check rejects the (common) non-header lines in one call
+            if not line.startswith(_LINE_PREFIXES):
+                continue
+            header, _, value = line.partition(":")
+            if header == "QUERY_SATISFIED":
+                result["satisfied"] = "YES" in value
+            else:
+                result[_PREFIX_FIELDS[header]] = value.strip()
         
         # Get full analysis text
         if "ANALYSIS:" in content:
@@ -131,20 +140,21 @@ Analyze if this comprehensive research satisfies the query. Follow the output fo
         """Final analysis with cached context and new results"""
         # Use full researcher output if available
         additional_content = ""
-        if cache.updated_results and cache.updated_results.get("researcher_output"):
+        if cache.updated_results and cache.updated_results["researcher_output"]:
             additional_content = f"Additional Research Output:\n{cache.updated_results['researcher_output']}"
         else:
-            additional_content = f"Additional Papers Summary:\n{self._summarize_papers(cache.updated_results.get('papers', []))}"
+            additional_content = f"Additional Papers Summary:\n{self._summarize_papers(cache.updated_results['papers'] if cache.updated_results else [])}"
         
         # Include initial research output if available
         initial_research = ""
         if cache.initial_research_output:
             initial_research = f"Initial Research Output:\n{cache.initial_research_output}\n\n"
         
-        response = await self.client.chat.completions.create(
+        response = await create_completion(
+            self.client,
             model=self.deployment,
             messages=[
-                {"role": "system", "content": BIOANALYSER_PROMPT},
+                _SYSTEM_MESSAGE,
                 {"role": "user", "content": f"""
 User Query: {cache.user_query}
 
@@ -154,7 +164,7 @@ Missing Information Requested: {cache.missing_analysis}
 
 {additional_content}
 
-Total papers found: {len(cache.updated_results.get('papers', [])) if cache.updated_results else 0} additional papers
+Total papers found: {len(cache.updated_results['papers']) if cache.updated_results else 0} additional papers
 
 Provide final comprehensive analysis combining all information."""}
             ],
@@ -164,16 +174,16 @@ Provide final comprehensive analysis combining all information."""}
         )
         
         # Collect streamed response
-        analysis = ""
+        parts = []
         async for chunk in response:
             # Check if choices exist and have content
             if chunk.choices and len(chunk.choices) > 0:
                 if chunk.choices[0].delta.content:
-                    analysis += chunk.choices[0].delta.content
+                    parts.append(chunk.choices[0].delta.content)
         
         return {
             "satisfied": True,
-            "analysis": analysis
+            "analysis": "".join(parts)
         }
     
     def _summarize_papers(self, papers: list) -> str:
@@ -5,24 +5,66 @@
 
 # AIDEV-SECTION: BioResearcher Agent with OpenAI Function Calling
 import os
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from typing import Dict, Any, List, Optional
-import json
-from datetime import datetime
-from openai import AsyncAzureOpenAI
+from openai.types.chat import ChatCompletionMessage, ChatCompletionMessageToolCall
+from openai.types.chat.chat_completion_message_tool_call import Function
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+from src.agents.openai_client import get_client, create_completion
 from src.tools.tool_definitions import TOOL_DEFINITIONS
 from src.tools import search_tools
 from src.models.paper import Paper
 from prompts import BIORESEARCHER_PROMPT
-from src.utils.raw_logger import log_method_call, log_method_result, log_openai_request, log_openai_response, log_raw
+from src.utils import fast_json
+from src.utils.coerce import as_str, parse_year_date
+from src.utils.raw_logger import log_method_call, log_method_result, log_openai_request, log_openai_message, log_raw
 
 logger = logging.getLogger(__name__)
 
+# AIDEV-NOTE: Paper extraction is CPU-bound (date regex + Paper validation per item);
+# run it on a shared pool so concurrent searches don't stall the event loop
+_EXTRACTION_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="paper-extract")
+
+# Map function names to actual implementations (built once, read-only)
+# AIDEV-NOTE: OpenAlex and PubMed Direct are now primary sources
+TOOL_FUNCTIONS = MappingProxyType({
+    "search_openalex": search_tools.search_openalex,
+    "search_pubmed_direct": search_tools.search_pubmed_direct,
+    "google_academic_search": search_tools.google_academic_search,
+    "search_papers": search_tools.search_papers,
+    "search_by_topic": search_tools.search_by_topic,
+    "search_pubmed": search_tools.search_pubmed,
+    "search_preprints": search_tools.search_preprints,
+    "search_clinical_trials": search_tools.search_clinical_trials,
+    "search_variants": search_tools.search_variants,
+})
+
+# Upper bound on tool calls in flight per researcher, to stay under external API rate limits
+MAX_CONCURRENT_TOOL_CALLS = 8
+
+# Titles echoed back to the model per tool call, enough to judge whether to refine the search
+MAX_TITLES_FOR_MODEL = 5
+
+# AIDEV-NOTE: raw_searches ends up in SearchResult.raw_data (served by /task/{id}), so each
+# result list is capped as soon as papers have been extracted from it - full tool payloads
+# never outlive the round that produced them
+MAX_RAW_ITEMS_PER_LIST = 50
+
+# AIDEV-NOTE: Shared by every search - the OpenAI SDK never mutates request messages,
+# so do not modify this dict in place
+_SYSTEM_MESSAGE = {"role": "system", "content": BIORESEARCHER_PROMPT}
+
+def _tool_message(tool_call_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a tool-role message; the single place tool content is serialized"""
+    return {"role": "tool", "tool_call_id": tool_call_id, "content": fast_json.dumps(payload)}
+
 class BioResearcher:
     """Agent that performs comprehensive biomedical searches using OpenAI function calling"""
     
@@ -41,37 +83,26 @@ class BioResearcher:
         
         logger.info(f"BioResearcher initializing with endpoint: {endpoint}, deployment: {deployment}")
         
-        self.client = AsyncAzureOpenAI(
-            azure_endpoint=endpoint,
-            api_key=api_key,
-            api_version="2025-01-01-preview"
-        )
+        self.client = get_client()
         self.deployment = deployment
         
-        # Map function names to actual implementations
-        # AIDEV-NOTE: OpenAlex and PubMed Direct are now primary sources
-        self.tool_functions = {
-            "search_openalex": search_tools.search_openalex,
-            "search_pubmed_direct": search_tools.search_pubmed_direct,
-            "google_academic_search": search_tools.google_academic_search,
-            "search_papers": search_tools.search_papers,
-            "search_by_topic": search_tools.search_by_topic,
-            "search_pubmed": search_tools.search_pubmed,
-            "search_preprints": search_tools.search_preprints,
-            "search_clinical_trials": search_tools.search_clinical_trials,
-            "search_variants": search_tools.search_variants,
-        }
+        self.tool_functions = TOOL_FUNCTIONS
+        self._tool_semaphore = asyncio.Semaphore(MAX_CONCURRENT_TOOL_CALLS)
     
     async def search(self, query: str) -> Dict[str, Any]:
-        """Execute comprehensive search using OpenAI function calling"""
-        logger.info(f"BioResearcher: Starting search for '{query}'")
+        """Execute comprehensive search using OpenAI function calling
+        
+        The result always has papers, raw_searches, tool_calls, analysis, reasoning_trace
+        and researcher_output keys, so callers can index it directly.
+        """
+        logger.info("BioResearcher: Starting search for '%s'", query)
         
         # Log method call
         log_method_call("BioResearcher", "search", {"query": query})
         
         # Initialize conversation with the query
         messages = [
-            {"role": "system", "content": BIORESEARCHER_PROMPT},
+            _SYSTEM_MESSAGE,
             {"role": "user", "content": f"Search comprehensively for: {query}"}
         ]
         
@@ -90,21 +121,9 @@ class BioResearcher:
                 # Log OpenAI request
                 log_openai_request("BioResearcher", self.deployment, messages, TOOL_DEFINITIONS)
                 
-                # Make API call with function calling
-                # AIDEV-NOTE: Fixed to use async client to prevent event loop blocking
-                response = await self.client.chat.completions.create(
-                    model=self.deployment,
-                    messages=messages,
-                    tools=TOOL_DEFINITIONS,
-                    tool_choice="auto",  # Let GPT decide which tools to use
-                    temperature=1.0,  # gpt-4.1 only supports default temperature
-                    max_completion_tokens=800  # As per Azure guide for gpt-4.1
-                )
-                
-                # Log OpenAI response
-                log_openai_response("BioResearcher", self.deployment, response)
-                
-                message = response.choices[0].message
+                # Stream the completion; tool calls start executing as soon as their
+                # arguments are complete, overlapping tool I/O with the rest of generation
+                message, tool_tasks, tool_arguments = await self._stream_round(messages)
                 
                 # Add assistant's response to conversation
                 messages.append(message.model_dump())
@@ -119,37 +138,42 @@ class BioResearcher:
                 
                 # Check if assistant wants to call tools
                 if message.tool_calls:
-                    logger.info(f"\n=== Round {round} Tool Calls ===")
-                    logger.info(f"Assistant reasoning: {message.content if message.content else 'No explicit reasoning'}")
-                    logger.info(f"Number of tools to call: {len(message.tool_calls)}")
+                    # Lazy %-style args: nothing is formatted when INFO is disabled
+                    logger.info("\n=== Round %s Tool Calls ===", round)
+                    logger.info("Assistant reasoning: %s", message.content or "No explicit reasoning")
+                    logger.info("Number of tools to call: %s", len(message.tool_calls))
                     
-                    # Execute all tool calls in parallel
-                    tool_results = await self._execute_tool_calls(message.tool_calls)
+                    # Tool calls are already running in parallel - wait for the stragglers
+                    tool_results = await asyncio.gather(*tool_tasks)
                     
                     # Add tool results to conversation
-                    for tool_call, result in zip(message.tool_calls, tool_results):
+                    for tool_call, tool_args, result in zip(message.tool_calls, tool_arguments, tool_results):
                         # Store raw results
                         tool_name = tool_call.function.name
-                        tool_args = json.loads(tool_call.function.arguments)
-                        logger.info(f"Tool: {tool_name}, Args: {tool_args}")
+                        logger.info("Tool: %s, Args: %s", tool_name, tool_args)
                         
-                        all_results["raw_searches"][f"{tool_name}_{round}"] = result
+                        # AIDEV-NOTE: raw_searches holds the only retained copy of each result;
+                        # tool_calls entries point at it by key (the id keeps repeat calls apart)
+                        response_key = f"{tool_name}_{round}_{tool_call.id}"
                         all_results["tool_calls"].append({
                             "tool": tool_name,
                             "arguments": tool_args,
-                            "round": round
+                            "round": round,
+                            "response_key": response_key
                         })
                         
                         # Extract papers from results
-                        papers = self._extract_papers_from_result(result, tool_name)
+                        papers = await asyncio.get_running_loop().run_in_executor(
+                            _EXTRACTION_EXECUTOR, self._extract_papers_from_result, result, tool_name
+                        )
                         all_results["papers"].extend(papers)
                         
-                        # Add tool result to messages
-                        messages.append({
-                            "role": "tool",
-                            "tool_call_id": tool_call.id,
-                            "content": json.dumps(result)[:5000]  # Limit size
-                        })
+                        # Add tool result to messages - a compact summary only; the full results
+                        # reach the analyser through the research dump
+                        messages.append(_tool_message(tool_call.id, self._summarize_for_model(result, papers)))
+                        
+                        # Papers are extracted, so only a trimmed copy outlives this round
+                        all_results["raw_searches"][response_key] = self._trim_raw_result(result)
                 else:
                     # No more tool calls, get final analysis
                     if message.content:
@@ -180,49 +204,154 @@ class BioResearcher:
     
     async def search_specific(self, missing_info: str) -> Dict[str, Any]:
         """Search for specific missing information"""
-        logger.info(f"BioResearcher: Searching for missing info: {missing_info}")
-        
-        messages = [
-            {"role": "system", "content": BIORESEARCHER_PROMPT},
-            {"role": "user", "content": f"Find specific information about: {missing_info}"}
-        ]
+        logger.info("BioResearcher: Searching for missing info: %s", missing_info)
         
         # Similar process but focused on missing info
         return await self.search(missing_info)
     
-    async def _execute_tool_calls(self, tool_calls) -> List[Dict[str, Any]]:
-        """Execute multiple tool calls in parallel"""
-        import asyncio
+    async def _stream_round(self, messages: List[Dict[str, Any]]):
+        """Stream one completion, starting each tool call as soon as its arguments are complete.
+        
+        Returns the assembled assistant message, one task per tool call and the parsed arguments
+        of each call (None if they were not valid JSON), both in tool_calls order.
+        """
+        # AIDEV-NOTE: Tool call deltas arrive in index order, so the first delta for index N
+        # means every call below N is complete and can be dispatched immediately
+        response = await create_completion(
+            self.client,
+            model=self.deployment,
+            messages=messages,
+            # AIDEV-NOTE: Static tool schema goes through extra_body, which the SDK merges into the
+            # request as-is; passing tools= re-runs its recursive param transform on every call
+            extra_body={"tools": TOOL_DEFINITIONS},
+            tool_choice="auto",  # Let GPT decide which tools to use
+            temperature=1.0,  # gpt-4.1 only supports default temperature
+            max_completion_tokens=800,  # As per Azure guide for gpt-4.1
+            stream=True,
+            stream_options={"include_usage": True}
+        )
         
-        async def execute_single_tool(tool_call):
+        content_parts = []
+        pending_calls: Dict[int, Dict[str, Any]] = {}
+        tool_calls: Dict[int, ChatCompletionMessageToolCall] = {}
+        tool_tasks: Dict[int, asyncio.Task] = {}
+        tool_arguments: Dict[int, Any] = {}
+        finish_reason = None
+        usage = None
+        
+        def dispatch(index: int):
+            call = pending_calls.pop(index)
+            tool_call = ChatCompletionMessageToolCall(
+                id=call["id"],
+                type="function",
+                function=Function(name=call["name"], arguments="".join(call["arguments"]))
+            )
+            tool_calls[index] = tool_call
+            # Arguments are parsed exactly once here and shared with the round loop
             try:
-                function_name = tool_call.function.name
-                arguments = json.loads(tool_call.function.arguments)
-                
-                logger.info(f"Executing {function_name} with args: {arguments}")
-                
-                # Handle web_search specially (it's built into OpenAI)
-                if function_name == "web_search":
-                    # Web search is handled by OpenAI internally
-                    return {"info": "Web search executed by OpenAI"}
-                
-                # Execute our custom tools
-                if function_name in self.tool_functions:
-                    result = await self.tool_functions[function_name](**arguments)
-                    return result
-                else:
-                    return {"error": f"Unknown tool: {function_name}"}
-                    
-            except Exception as e:
-                logger.error(f"Error executing {tool_call.function.name}: {e}")
-                return {"error": str(e)}
+                arguments = fast_json.loads(tool_call.function.arguments)
+            except ValueError:
+                arguments = None
+            tool_arguments[index] = arguments
+            tool_tasks[index] = asyncio.create_task(self._execute_tool_call(tool_call, arguments))
         
-        # Execute all tools in parallel using asyncio.gather
-        # AIDEV-NOTE: Running all tools in parallel as per user request
-        logger.info(f"Executing {len(tool_calls)} tools in parallel")
-        results = await asyncio.gather(*[execute_single_tool(tc) for tc in tool_calls])
+        try:
+            async for chunk in response:
+                if chunk.usage:
+                    usage = chunk.usage
+                if not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+                delta = choice.delta
+                if delta.content:
+                    content_parts.append(delta.content)
+                for tc_delta in delta.tool_calls or []:
+                    for index in [i for i in pending_calls if i < tc_delta.index]:
+                        dispatch(index)
+                    call = pending_calls.setdefault(tc_delta.index, {"id": "", "name": "", "arguments": []})
+                    if tc_delta.id:
+                        call["id"] = tc_delta.id
+                    if tc_delta.function:
+                        if tc_delta.function.name:
+                            call["name"] += tc_delta.function.name
+                        if tc_delta.function.arguments:
+                            call["arguments"].append(tc_delta.function.arguments)
+            
+            for index in sorted(pending_calls):
+                dispatch(index)
+        except BaseException:
+            for task in tool_tasks.values():
+                task.cancel()
+            raise
+        
+        order = sorted(tool_calls)
+        message = ChatCompletionMessage(
+            role="assistant",
+            content="".join(content_parts) or None,
+            tool_calls=[tool_calls[i] for i in order] or None
+        )
+        log_openai_message("BioResearcher", self.deployment, message, finish_reason, usage)
         
-        return results
+        if order:
+            logger.info("Executing %s tools in parallel", len(order))
+        return message, [tool_tasks[i] for i in order], [tool_arguments[i] for i in order]
+    
+    async def _execute_tool_call(self, tool_call, arguments: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Execute a single tool call, returning an error dict instead of raising"""
+        try:
+            function_name = tool_call.function.name
+            if arguments is None:
+                return {"error": f"Invalid JSON arguments for {function_name}"}
+            
+            logger.info("Executing %s with args: %s", function_name, arguments)
+            
+            # Handle web_search specially (it's built into OpenAI)
+            if function_name == "web_search":
+                # Web search is handled by OpenAI internally
+                return {"info": "Web search executed by OpenAI"}
+            
+            # Execute our custom tools
+            # AIDEV-NOTE: All tools of a round run in parallel; _tool_semaphore caps how many
+            # hit the network at once
+            if function_name in self.tool_functions:
+                async with self._tool_semaphore:
+                    result = await self.tool_functions[function_name](**arguments)
+                return result
+            else:
+                return {"error": f"Unknown tool: {function_name}"}
+                
+        except Exception as e:
+            logger.error(f"Error executing {tool_call.function.name}: {e}")
+            return {"error": str(e)}
+    
+    def _summarize_for_model(self, result: Dict[str, Any], papers: List[Paper]) -> Dict[str, Any]:
+        """Compact tool message content: paper count, sample titles and any tool error"""
+        summary = {
+            "papers_found": len(papers),
+            "sample_titles": [paper.title[:120] for paper in papers[:MAX_TITLES_FOR_MODEL]]
+        }
+        if isinstance(result, dict) and result.get("error"):
+            summary["error"] = str(result["error"])
+        return summary
+    
+    def _trim_raw_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Cap each result list at MAX_RAW_ITEMS_PER_LIST, flagging the result and recording the
+        original lengths of any lists that were cut"""
+        if not isinstance(result, dict):
+            return result
+        trimmed = {}
+        original_counts = {}
+        for key, value in result.items():
+            if isinstance(value, list) and len(value) > MAX_RAW_ITEMS_PER_LIST:
+                original_counts[key] = len(value)
+                value = value[:MAX_RAW_ITEMS_PER_LIST]
+            trimmed[key] = value
+        if original_counts:
+            trimmed["_truncated"] = True
+            trimmed["_original_counts"] = original_counts
+        return trimmed
     
     def _extract_papers_from_result(self, result: Dict[str, Any], tool_name: str) -> List[Paper]:
         """Extract paper metadata from tool results"""
@@ -270,7 +399,7 @@ class BioResearcher:
         """Create a Paper object from a result item"""
         try:
             # Handle different field names
-            title = item.get("title") or item.get("briefTitle") or ""
+            title = as_str(item.get("title") or item.get("briefTitle")) or ""
             
             # Handle authors - could be string or list
             authors = item.get("authors", [])
@@ -280,21 +409,26 @@ class BioResearcher:
                 authors = []
             
             # Handle Google search results
-            abstract = item.get("abstract") or item.get("summary") or item.get("snippet") or ""
-            url = item.get("url") or item.get("link") or item.get("doi") or ""
+            abstract = as_str(item.get("abstract") or item.get("summary") or item.get("snippet")) or ""
+            url = as_str(item.get("url") or item.get("link") or item.get("doi")) or ""
             publication_date = item.get("year") or item.get("date") or item.get("pubYear") or item.get("publication_date")
             
-            # Create Paper object
-            paper = Paper(
+            citations = item.get("citations", 0)
+            if not isinstance(citations, int):
+                citations = int(citations) if isinstance(citations, str) and citations.isdigit() else 0
+            
+            # AIDEV-NOTE: model_construct skips Pydantic validation (the hot spot for large result
+            # sets); every field is coerced to its declared type above, so keep it that way when editing
+            paper = Paper.model_construct(
                 title=title,
                 abstract=abstract,
-                authors=authors[:10],  # Limit authors
-                citations=item.get("citations", 0),
-                publication_date=self._parse_date(publication_date),
+                authors=[a for a in authors[:10] if isinstance(a, str)],  # Limit authors
+                citations=citations,
+                publication_date=parse_year_date(publication_date),
                 hyperlink=url,
                 source=source,
-                doi=item.get("doi"),
-                journal=item.get("journal") or item.get("venue") or item.get("source")
+                doi=as_str(item.get("doi")),
+                journal=as_str(item.get("journal") or item.get("venue") or item.get("source"))
             )
             
             return paper
@@ -303,33 +437,13 @@ class BioResearcher:
             logger.error(f"Error creating paper: {e}")
             return None
     
-    def _parse_date(self, date_value):
-        """Parse various date formats"""
-        if not date_value:
-            return None
-            
-        try:
-            if isinstance(date_value, int):
-                return datetime(date_value, 1, 1)
-            elif isinstance(date_value, str):
-                # Try to extract year
-                import re
-                year_match = re.search(r'\d{4}', str(date_value))
-                if year_match:
-                    return datetime(int(year_match.group()), 1, 1)
-        except:
-            pass
-            
-        return None
-    
     def _deduplicate_papers(self, papers: List[Paper]) -> List[Paper]:
         """Remove duplicate papers based on title and DOI"""
         seen = set()
         unique_papers = []
         
         for paper in papers:
-            # Create unique key
-            key = (paper.title.lower(), paper.doi) if paper.doi else paper.title.lower()
+            key = paper.dedup_key
             
             if key not in seen:
                 seen.add(key)
@@ -390,7 +504,9 @@ class BioResearcher:
         for search_key, results in raw_searches.items():
             if isinstance(results, dict) and "results" in results:
                 output_sections.append(f"\n### {search_key}")
-                output_sections.append(f"Results count: {len(results.get('results', []))}")
+                # Count from before the result was trimmed to MAX_RAW_ITEMS_PER_LIST
+                results_count = results.get("_original_counts", {}).get("results", len(results.get("results", [])))
+                output_sections.append(f"Results count: {results_count}")
                 
                 # Include any additional abstracts from raw results that might have been missed
                 for item in results.get("results", [])[:5]:  # First 5 from each source
@@ -0,0 +1,158 @@
+# AIDEV-SECTION: Shared Azure OpenAI Client
+"""
+Process-wide AsyncAzureOpenAI client shared by all agents.
+One client means one httpx connection pool, so TCP/TLS connections to the
+Azure endpoint are reused across BioResearcher, BioAnalyser and SummarizerAgent.
+All chat completion calls go through create_completion() for rate limiting and retries.
+"""
+import os
+import time
+import random
+import asyncio
+import logging
+import httpx
+import openai
+from typing import Optional
+from openai import AsyncAzureOpenAI
+from dotenv import load_dotenv
+
+from src.utils import fast_json
+
+# Load environment variables
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+API_VERSION = "2025-01-01-preview"
+
+# AIDEV-NOTE: Read timeout stays at the openai default (600s) - o4-mini calls with
+# 100k completion tokens routinely run for minutes
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30.0)
+HTTP_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+
+_client: Optional[AsyncAzureOpenAI] = None
+
+
+def get_client() -> AsyncAzureOpenAI:
+    """Return the shared client, creating it on first use"""
+    global _client
+    if _client is None:
+        endpoint = os.getenv("ENDPOINT_URL")
+        api_key = os.getenv("AZURE_OPENAI_API_KEY")
+        if not endpoint:
+            raise RuntimeError("ENDPOINT_URL environment variable is required.")
+        if not api_key:
+            raise RuntimeError("AZURE_OPENAI_API_KEY environment variable is required.")
+
+        _client = AsyncAzureOpenAI(
+            azure_endpoint=endpoint,
+            api_key=api_key,
+            api_version=API_VERSION,
+            max_retries=0,  # Retries are handled by create_completion
+            http_client=httpx.AsyncClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+        )
+    return _client
+
+
+async def warm_up(client: Optional[AsyncAzureOpenAI] = None):
+    """Open a pooled connection to the Azure endpoint so the first real call skips DNS/TLS setup"""
+    try:
+        await (client or get_client()).models.list()
+        logger.info("Azure OpenAI connection warmed up")
+    except Exception as e:
+        # Best effort - the first agent call will simply connect as before
+        logger.warning(f"Azure OpenAI warm-up failed: {e}")
+
+
+# AIDEV-SECTION: Rate Limiting and Retries
+# Optional client-side quota matching the Azure deployment; unset means no throttling
+AZURE_OPENAI_RPM = int(os.getenv("AZURE_OPENAI_RPM") or 0)
+AZURE_OPENAI_TPM = int(os.getenv("AZURE_OPENAI_TPM") or 0)
+
+MAX_ATTEMPTS = 5
+RETRY_MIN_WAIT = 1.0
+RETRY_MAX_WAIT = 30.0
+# APITimeoutError is a subclass of APIConnectionError
+RETRYABLE_ERRORS = (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)
+
+
+class AsyncTokenBucket:
+    """Requests-per-minute and tokens-per-minute limiter for one deployment"""
+    
+    def __init__(self, rpm: int, tpm: int):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.requests = float(rpm)
+        self.tokens = float(tpm)
+        self.last_refill = time.monotonic()
+        # Only guards the bookkeeping - nobody sleeps while holding it
+        self._lock = asyncio.Lock()
+    
+    def _refill(self):
+        now = time.monotonic()
+        elapsed_minutes = (now - self.last_refill) / 60.0
+        self.last_refill = now
+        self.requests = min(self.rpm, self.requests + elapsed_minutes * self.rpm)
+        self.tokens = min(self.tpm, self.tokens + elapsed_minutes * self.tpm)
+    
+    async def acquire(self, tokens_needed: int):
+        """Reserve one request and tokens_needed tokens, then wait until the reservation is covered"""
+        # A request larger than the whole bucket could never be admitted
+        tokens_needed = min(tokens_needed, self.tpm)
+        async with self._lock:
+            self._refill()
+            # AIDEV-NOTE: Reserving up front (the balance may go negative) keeps callers in
+            # arrival order without holding the lock across the sleep
+            wait_minutes = max(0.0, (1 - self.requests) / self.rpm, (tokens_needed - self.tokens) / self.tpm)
+            self.requests -= 1
+            self.tokens -= tokens_needed
+        if wait_minutes > 0:
+            await asyncio.sleep(wait_minutes * 60.0)
+
+
+# Azure enforces quota per deployment, so each model gets its own bucket
+_rate_limiters: dict = {}
+
+
+def _get_rate_limiter(model: Optional[str]) -> Optional[AsyncTokenBucket]:
+    """Return the bucket for a deployment, or None when client-side throttling is off"""
+    if not (AZURE_OPENAI_RPM and AZURE_OPENAI_TPM):
+        return None
+    limiter = _rate_limiters.get(model)
+    if limiter is None:
+        limiter = _rate_limiters[model] = AsyncTokenBucket(AZURE_OPENAI_RPM, AZURE_OPENAI_TPM)
+    return limiter
+
+
+def _retry_delay(attempt: int, error: Exception) -> float:
+    """Honor Retry-After when Azure sends one, else exponential backoff with full jitter"""
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after:
+        try:
+            return min(float(retry_after), RETRY_MAX_WAIT)
+        except ValueError:
+            pass
+    return max(RETRY_MIN_WAIT, random.uniform(0, min(RETRY_MAX_WAIT, RETRY_MIN_WAIT * 2 ** attempt)))
+
+
+async def create_completion(client: AsyncAzureOpenAI, **kwargs):
+    """chat.completions.create with rate limiting and bounded retries on 429/5xx/connection errors"""
+    rate_limiter = _get_rate_limiter(kwargs.get("model"))
+    if rate_limiter:
+        # Rough token estimate: ~4 characters per token, plus the full completion budget
+        # (Azure counts max_completion_tokens against TPM up front)
+        tokens_needed = len(fast_json.dumps(kwargs.get("messages", []))) // 4 + kwargs.get("max_completion_tokens", 0)
+    
+    for attempt in range(MAX_ATTEMPTS):
+        if rate_limiter:
+            await rate_limiter.acquire(tokens_needed)
+        try:
+            return await client.chat.completions.create(**kwargs)
+        except RETRYABLE_ERRORS as e:
+            if attempt == MAX_ATTEMPTS - 1:
+                raise
+            delay = _retry_delay(attempt, e)
+            logger.warning(f"Azure OpenAI call failed ({type(e).__name__}), retrying in {delay:.1f}s "
+                           f"(attempt {attempt + 1}/{MAX_ATTEMPTS})")
+            await asyncio.sleep(delay)
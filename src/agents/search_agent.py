@@ -1,16 +1,24 @@
 # AIDEV-SECTION: Search Agent - Coordinates BioResearcher, BioAnalyser, and Summarizer
+import asyncio
+import hashlib
+import inspect
 import logging
+from collections import OrderedDict
 from typing import Dict, Any, List
 
 from src.models.search import SearchResult, AnalysisCache
 from src.models.paper import Paper
 from src.agents.bioresearcher import BioResearcher
 from src.agents.bioanalyser import BioAnalyser
-from src.agents.summarizer import SummarizerAgent
+from src.agents.summarizer import SummarizerAgent, FallbackSummary
 from src.utils.raw_logger import log_method_call, log_method_result, log_raw
+from src.utils.semantic_cache import SemanticCache
 
 logger = logging.getLogger(__name__)
 
+# Per-query state kept for the follow-up analysis; oldest entries are evicted beyond this
+MAX_CACHED_ANALYSES = 128
+
 class SearchAgent:
     """Manages the search workflow between BioResearcher and BioAnalyser"""
     
@@ -21,10 +29,20 @@ class SearchAgent:
         self.analyser = BioAnalyser()
         self.summarizer = SummarizerAgent()
         
-        self.cache = {}  # Simple in-memory cache
+        self.cache = OrderedDict()  # In-memory LRU of AnalysisCache, see MAX_CACHED_ANALYSES
+        # AIDEV-NOTE: Completed results keyed by query meaning - paraphrased repeats skip the whole pipeline
+        self.result_cache = SemanticCache()
     
     async def execute(self, query: str, progress_callback=None, paper_callback=None, stream_callback=None) -> SearchResult:
-        """Execute search with MANDATORY feedback loop"""
+        """Execute search with MANDATORY feedback loop
+        
+        Callbacks must be async functions; each call is awaited directly (or run as a task),
+        never wrapped in asyncio.wait.
+        """
+        for callback in (progress_callback, paper_callback, stream_callback):
+            if callback is not None and not inspect.iscoroutinefunction(callback):
+                raise TypeError(f"SearchAgent callbacks must be async functions, got {callback!r}")
+        
         # Log workflow start
         log_raw({
             "type": "WORKFLOW_START",
@@ -32,61 +50,100 @@ class SearchAgent:
             "query": query
         })
         
+        cached_result = await self.result_cache.get(query)
+        if cached_result is not None:
+            logger.info("Returning cached result for: %s", query)
+            if paper_callback and cached_result.papers:
+                await paper_callback(cached_result.papers, "initial")
+            if stream_callback:
+                await stream_callback(cached_result.analysis)
+            if progress_callback:
+                await progress_callback("Search complete", 100)
+            log_raw({
+                "type": "WORKFLOW_CACHE_HIT",
+                "agent": "SearchAgent",
+                "query": query,
+                "cached_query": cached_result.query
+            })
+            return cached_result
+        
         # Step 1: Initial research
-        logger.info(f"Starting research for: {query}")
-        if progress_callback:
-            await progress_callback("Starting initial research phase", 20)
+        logger.info("Starting research for: %s", query)
+        # AIDEV-NOTE: Callbacks are fired as tasks so WebSocket sends overlap with agent work;
+        # they are all awaited before returning so no update is lost
+        pending_callbacks = []
+        
+        def notify(callback, *args):
+            if callback:
+                pending_callbacks.append(asyncio.create_task(callback(*args)))
+        
+        notify(progress_callback, "Starting initial research phase", 20)
         
         research_data = await self.researcher.search(query)
         
         # Stream papers immediately after initial research
-        if paper_callback and research_data.get('papers'):
-            await paper_callback(research_data['papers'], "initial")
+        if research_data['papers']:
+            notify(paper_callback, research_data['papers'], "initial")
         
-        if progress_callback:
-            await progress_callback(f"Found {len(research_data.get('papers', []))} papers, analyzing results", 40)
+        notify(progress_callback, f"Found {len(research_data['papers'])} papers, analyzing results", 40)
         
         # Step 2: Analysis - ALWAYS get suggestions for additional searches
         analysis_result = await self.analyser.analyze(query, research_data)
         
         # Step 3: MANDATORY feedback loop - analyser always suggests additional searches
-        logger.info("Executing mandatory feedback loop with analyser suggestions")
         missing_info = analysis_result.get("missing_info", analysis_result.get("suggested_searches", ""))
         
-        if progress_callback:
-            await progress_callback("Searching based on analyser suggestions", 60)
-        
-        # Cache the state including full research output
-        cache_key = f"search_{hash(query)}"
-        self.cache[cache_key] = AnalysisCache(
-            user_query=query,
-            previous_output=analysis_result["analysis"],
-            missing_analysis=missing_info,
-            initial_research_output=research_data.get("researcher_output", "")
-        )
-        
-        # Step 4: Execute additional research based on analyser suggestions
-        additional_data = await self.researcher.search_specific(missing_info)
-        
-        # Stream additional papers as they're found
-        if paper_callback and additional_data.get('papers'):
-            await paper_callback(additional_data['papers'], "additional")
-        
-        if progress_callback:
-            await progress_callback("Finalizing comprehensive analysis", 80)
-        
-        # Step 5: Final analysis with all data
-        cache_data = self.cache[cache_key]
-        cache_data.updated_results = additional_data
-        
-        final_analysis = await self.analyser.analyze_with_cache(cache_data)
-        
-        # Combine all papers from both searches and deduplicate
-        combined_papers = research_data["papers"] + additional_data.get("papers", [])
-        all_papers = self._deduplicate_papers(combined_papers)
+        if not missing_info.strip():
+            # AIDEV-NOTE: Nothing for the researcher to look for - a follow-up round would
+            # search an empty query and re-analyse the same papers
+            logger.info("Analyser reported no missing information, skipping follow-up research")
+            additional_data = {}
+            final_analysis = {"analysis": None}
+            all_papers = self._deduplicate_papers(research_data["papers"])
+            all_tool_calls = research_data["tool_calls"]
+            all_trace = research_data["reasoning_trace"]
+        else:
+            logger.info("Executing mandatory feedback loop with analyser suggestions")
+            
+            notify(progress_callback, "Searching based on analyser suggestions", 60)
+            
+            # Cache the state including full research output
+            # AIDEV-NOTE: Stable across processes (hash() is salted per process), so the key
+            # can be shared with an external cache later
+            cache_key = f"search_{hashlib.blake2b(query.encode(), digest_size=8).hexdigest()}"
+            cache_data = self.cache[cache_key] = AnalysisCache(
+                user_query=query,
+                previous_output=analysis_result["analysis"],
+                missing_analysis=missing_info,
+                initial_research_output=research_data["researcher_output"]
+            )
+            self.cache.move_to_end(cache_key)
+            if len(self.cache) > MAX_CACHED_ANALYSES:
+                self.cache.popitem(last=False)
+            
+            # Step 4: Execute additional research based on analyser suggestions
+            additional_data = await self.researcher.search_specific(missing_info)
+            
+            # Stream additional papers as they're found
+            if additional_data['papers']:
+                notify(paper_callback, additional_data['papers'], "additional")
+            
+            notify(progress_callback, "Finalizing comprehensive analysis", 80)
+            
+            # Step 5: Final analysis with all data
+            # Local reference - concurrent searches may have evicted the entry by now
+            cache_data.updated_results = additional_data
+            
+            final_analysis = await self.analyser.analyze_with_cache(cache_data)
+            
+            # Combine all papers from both searches and deduplicate
+            all_papers = self._merge_dedup(research_data["papers"], additional_data["papers"])
+            
+            # Merged once, shared by the summarizer, the log entry and the result
+            all_tool_calls = [*research_data["tool_calls"], *additional_data["tool_calls"]]
+            all_trace = [*research_data["reasoning_trace"], *additional_data["reasoning_trace"]]
         
-        if progress_callback:
-            await progress_callback("Creating comprehensive scientific summary", 90)
+        notify(progress_callback, "Creating comprehensive scientific summary", 90)
         
         # Step 6: ALWAYS use SummarizerAgent for final comprehensive response after feedback loop
         # AIDEV-NOTE: Mandatory feedback loop ensures comprehensive coverage
@@ -95,12 +152,16 @@ class SearchAgent:
             papers=all_papers,
             initial_analysis=analysis_result["analysis"],
             feedback_analysis=final_analysis["analysis"],
-            tool_calls=research_data.get("tool_calls", []) + additional_data.get("tool_calls", []),
+            tool_calls=all_tool_calls,
             stream_callback=stream_callback
         )
         
-        if progress_callback:
-            await progress_callback("Search complete", 100)
+        notify(progress_callback, "Search complete", 100)
+        if pending_callbacks:
+            # A failed update must not fail the search, but it shouldn't vanish either
+            for outcome in await asyncio.gather(*pending_callbacks, return_exceptions=True):
+                if isinstance(outcome, Exception):
+                    logger.warning("Search callback failed: %r", outcome)
         
         # Log workflow completion
         log_raw({
@@ -108,29 +169,45 @@ class SearchAgent:
             "agent": "SearchAgent",
             "query": query,
             "total_papers": len(all_papers),
-            "total_tool_calls": len(research_data.get("tool_calls", []) + additional_data.get("tool_calls", []))
+            "total_tool_calls": len(all_tool_calls)
         })
         
-        return SearchResult(
+        result = SearchResult(
             query=query,
             papers=all_papers,
             analysis=final_summary,
-            raw_data={**research_data, **additional_data},
-            tool_calls=research_data.get("tool_calls", []) + additional_data.get("tool_calls", []),
-            reasoning_trace=research_data.get("reasoning_trace", []) + additional_data.get("reasoning_trace", [])
+            # AIDEV-NOTE: Both rounds' raw_searches are kept - every tool_calls[*].response_key
+            # must resolve, and the follow-up round's dict would otherwise replace the first's
+            raw_data={
+                **research_data,
+                **additional_data,
+                "raw_searches": {**research_data["raw_searches"], **additional_data.get("raw_searches", {})}
+            },
+            tool_calls=all_tool_calls,
+            reasoning_trace=all_trace
         )
+        # Degraded results (no papers, or the summarizer fell back to its template) are not reused
+        if all_papers and not isinstance(final_summary, FallbackSummary):
+            await self.result_cache.put(query, result)
+        
+        return result
     
     def _deduplicate_papers(self, papers: List[Paper]) -> List[Paper]:
         """Remove duplicate papers based on title and DOI"""
+        return self._merge_dedup(papers)
+    
+    def _merge_dedup(self, *paper_lists: List[Paper]) -> List[Paper]:
+        """Deduplicate several paper lists in one pass, keeping first occurrences in order"""
+        # AIDEV-NOTE: Walks the inputs directly rather than concatenating them first
         seen = set()
         unique_papers = []
         
-        for paper in papers:
-            # Create unique key - use lowercase title and DOI if available
-            key = (paper.title.lower(), paper.doi) if paper.doi else paper.title.lower()
-            
-            if key not in seen:
-                seen.add(key)
-                unique_papers.append(paper)
+        for papers in paper_lists:
+            for paper in papers:
+                key = paper.dedup_key
+                
+                if key not in seen:
+                    seen.add(key)
+                    unique_papers.append(paper)
         
         return unique_papers
\ No newline at end of file
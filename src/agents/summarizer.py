@@ -2,9 +2,9 @@
 import os
 import logging
 from typing import Dict, Any, List
-from openai import AsyncAzureOpenAI
 from dotenv import load_dotenv
 
+from src.agents.openai_client import get_client, create_completion
 from src.models.paper import Paper
 from prompts import SUMMARIZER_PROMPT
 from src.utils.raw_logger import log_method_call, log_method_result, log_openai_request, log_openai_response
@@ -14,6 +14,14 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# AIDEV-NOTE: Streamed summary text is forwarded in batches of at least this many characters;
+# one WebSocket send per token costs far more than the token itself
+STREAM_BATCH_CHARS = 200
+
+
+class FallbackSummary(str):
+    """Summary text built locally after the model call failed; callers can tell it apart with isinstance"""
+
 class SummarizerAgent:
     """Agent that creates structured scientific responses from search results"""
     
@@ -30,11 +38,7 @@ class SummarizerAgent:
             
         logger.info(f"SummarizerAgent initializing with endpoint: {endpoint}, deployment: {deployment}")
         
-        self.client = AsyncAzureOpenAI(
-            api_key=api_key,
-            api_version="2025-01-01-preview",
-            azure_endpoint=endpoint,
-        )
+        self.client = get_client()
         self.deployment = deployment
         
         # AIDEV-NOTE: Using centralized prompt from prompts.py
@@ -46,11 +50,12 @@ class SummarizerAgent:
                        initial_analysis: str,
                        feedback_analysis: str = None,
                        tool_calls: List[Dict] = None,
-                       stream_callback = None) -> str:
+                       stream_callback = None,
+                       stream_batch_chars: int = STREAM_BATCH_CHARS) -> str:
         """Create a structured scientific summary of all search results"""
         
-        logger.info(f"Summarizing results for query: {query}")
-        logger.info(f"Total papers to summarize: {len(papers)}")
+        logger.info("Summarizing results for query: %s", query)
+        logger.info("Total papers to summarize: %s", len(papers))
         
         # Log method call
         log_method_call("SummarizerAgent", "summarize", {
@@ -98,7 +103,8 @@ Based on ALL the above information, create a comprehensive scientific response t
             
             # Use streaming if callback provided
             if stream_callback:
-                response = await self.client.chat.completions.create(
+                response = await create_completion(
+                    self.client,
                     model=self.deployment,
                     messages=messages,
                     temperature=1.0,  # Default temperature for this model
@@ -107,19 +113,31 @@ Based on ALL the above information, create a comprehensive scientific response t
                 )
                 
                 # Collect full response while streaming
-                summary = ""
+                parts = []
+                batch = []
+                batch_len = 0
                 async for chunk in response:
                     if chunk.choices and len(chunk.choices) > 0:
                         if chunk.choices[0].delta.content:
                             chunk_content = chunk.choices[0].delta.content
-                            summary += chunk_content
-                            # Stream each chunk to frontend
-                            await stream_callback(chunk_content)
+                            parts.append(chunk_content)
+                            batch.append(chunk_content)
+                            batch_len += len(chunk_content)
+                            # Stream batched chunks to frontend
+                            if batch_len >= stream_batch_chars:
+                                await stream_callback("".join(batch))
+                                batch = []
+                                batch_len = 0
                 
-                logger.info(f"Successfully created streamed summary, length: {len(summary)}")
+                if batch:
+                    await stream_callback("".join(batch))
+                summary = "".join(parts)
+                
+                logger.info("Successfully created streamed summary, length: %s", len(summary))
             else:
                 # Non-streaming response
-                response = await self.client.chat.completions.create(
+                response = await create_completion(
+                    self.client,
                     model=self.deployment,
                     messages=messages,
                     temperature=1.0,  # Default temperature for this model
@@ -130,7 +148,7 @@ Based on ALL the above information, create a comprehensive scientific response t
                 log_openai_response("SummarizerAgent", self.deployment, response)
                 
                 summary = response.choices[0].message.content
-                logger.info(f"Successfully created summary, length: {len(summary)}")
+                logger.info("Successfully created summary, length: %s", len(summary))
             
             # Log method result
             log_method_result("SummarizerAgent", "summarize", {
@@ -150,20 +168,9 @@ Based on ALL the above information, create a comprehensive scientific response t
         if not papers:
             return "No papers found."
         
-        summaries = []
-        for i, paper in enumerate(papers, 1):
-            authors_str = ", ".join(paper.authors[:3]) + " et al." if paper.authors else "Unknown"
-            pub_date = paper.publication_date.strftime("%Y-%m") if paper.publication_date else "Unknown date"
-            
-            summary = f"""{i}. {paper.title}
-   Authors: {authors_str}
-   Source: {paper.source} | Published: {pub_date} | Citations: {paper.citations}
-   Abstract: {paper.abstract[:500]}{"..." if len(paper.abstract) > 500 else ""}
-   Link: {paper.hyperlink}
-"""
-            summaries.append(summary)
-        
-        return "\n".join(summaries)
+        # AIDEV-NOTE: Each paper's block is formatted once (Paper.summary_block) and reused
+        # by every summary that includes it
+        return "\n".join(f"{i}. {paper.summary_block}" for i, paper in enumerate(papers, 1))
     
     def _format_tool_summary(self, tool_calls: List[Dict]) -> str:
         """Format tool usage for summary"""
@@ -179,9 +186,9 @@ Based on ALL the above information, create a comprehensive scientific response t
         
         return "\n".join(summary_lines)
     
-    def _create_fallback_summary(self, query: str, papers: List[Paper], analysis: str) -> str:
+    def _create_fallback_summary(self, query: str, papers: List[Paper], analysis: str) -> "FallbackSummary":
         """Create a basic structured summary if API call fails"""
-        return f"""## Executive Summary
+        return FallbackSummary(f"""## Executive Summary
 
 Based on the search of {len(papers)} scientific papers, here is the analysis for your query: "{query}"
 
@@ -207,12 +214,8 @@ Based on the current findings, additional research may be needed to fully addres
 Consider exploring the cited papers and their references for more detailed information.
 
 ---
-*Note: This is a simplified summary. Some formatting features may be limited.*"""
+*Note: This is a simplified summary. Some formatting features may be limited.*""")
     
     def _format_top_papers_fallback(self, papers: List[Paper]) -> str:
         """Format top papers for fallback summary"""
-        lines = []
-        for i, paper in enumerate(papers, 1):
-            authors = ", ".join(paper.authors[:2]) + " et al." if len(paper.authors) > 2 else ", ".join(paper.authors)
-            lines.append(f"{i}. {paper.title} - {authors} ({paper.source})")
-        return "\n".join(lines)
\ No newline at end of file
+        return "\n".join(f"{i}. {paper.summary_block_short}" for i, paper in enumerate(papers, 1))
\ No newline at end of file
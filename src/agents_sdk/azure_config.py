@@ -1,7 +1,7 @@
 # AIDEV-SECTION: Azure OpenAI Configuration for SDK
 """
 Azure OpenAI configuration for the OpenAI Agents SDK.
-Sets up clients for different models (GPT-4.1 and o4-mini).
+Sets up one client shared by the GPT-4.1 and o4-mini agents.
 """
 import os
 import logging
@@ -23,22 +23,20 @@ O4MINI_DEPLOYMENT = os.getenv("AZURE_OPENAI_GPT4O_DEPLOYMENT_NAME", "o4-mini")
 if not ENDPOINT_URL or not API_KEY:
     raise ValueError("ENDPOINT_URL and AZURE_OPENAI_API_KEY must be set")
 
-# Create client for GPT-4.1
-gpt4_client = AsyncAzureOpenAI(
+# AIDEV-NOTE: Both deployments live on the same endpoint, so one client (one httpx connection
+# pool) serves every agent; the deployment is chosen per agent via the model name
+azure_client = AsyncAzureOpenAI(
     api_key=API_KEY,
     api_version="2025-01-01-preview",
     azure_endpoint=ENDPOINT_URL,
 )
 
-# Create client for o4-mini (same endpoint, different deployment)
-o4mini_client = AsyncAzureOpenAI(
-    api_key=API_KEY,
-    api_version="2025-01-01-preview",
-    azure_endpoint=ENDPOINT_URL,
-)
+# Kept for existing imports
+gpt4_client = azure_client
+o4mini_client = azure_client
 
-# Set default client (we'll override per agent)
-set_default_openai_client(gpt4_client)
+# Set default client
+set_default_openai_client(azure_client)
 
 # Use Chat Completions API as Azure doesn't support Responses API yet
 set_default_openai_api("chat_completions")
@@ -49,6 +47,7 @@ logger.info(f"o4-mini deployment: {O4MINI_DEPLOYMENT}")
 
 # Export deployment names for use in agents
 __all__ = [
+    "azure_client",
     "gpt4_client",
     "o4mini_client",
     "GPT4_DEPLOYMENT",
@@ -7,8 +7,7 @@ import logging
 from agents import Agent, ModelSettings
 from agents.models.openai_chatcompletions import OpenAIChatCompletionsModel
 from src.agents_sdk.azure_config import (
-    gpt4_client, 
-    o4mini_client, 
+    azure_client,
     GPT4_DEPLOYMENT, 
     O4MINI_DEPLOYMENT
 )
@@ -44,7 +43,7 @@ bioresearcher = Agent(
     ],
     model=OpenAIChatCompletionsModel(
         model=GPT4_DEPLOYMENT,
-        openai_client=gpt4_client
+        openai_client=azure_client
     ),
     model_settings=ModelSettings(
         temperature=0.7,  # Default temperature for gpt-4.1
@@ -59,7 +58,7 @@ bioanalyser = Agent(
     instructions=BIOANALYSER_PROMPT,
     model=OpenAIChatCompletionsModel(
         model=O4MINI_DEPLOYMENT,
-        openai_client=o4mini_client
+        openai_client=azure_client
     ),
     model_settings=ModelSettings(
         temperature=0.7,
@@ -74,7 +73,7 @@ summarizer = Agent(
     instructions=SUMMARIZER_PROMPT,
     model=OpenAIChatCompletionsModel(
         model=O4MINI_DEPLOYMENT,
-        openai_client=o4mini_client
+        openai_client=azure_client
     ),
     model_settings=ModelSettings(
         temperature=0.7,  # Slightly lower for more consistent summaries
@@ -3,38 +3,87 @@
 Extract Paper objects from SDK agent outputs.
 Converts string outputs back to structured Paper objects.
 """
-import json
 import logging
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+import sys
+from typing import List, Dict, Any, Optional, Tuple
 from agents import RunResult
-from agents.items import ToolCallOutputItem
+from agents.items import ToolCallItem, ToolCallOutputItem
 from src.models.paper import Paper
+from src.utils import fast_json
+from src.utils.coerce import as_str, parse_year_date
+from src.agents_sdk.sdk_tools import RAW_RESULT_TOKEN_MARKER, pop_raw_result
 
 logger = logging.getLogger(__name__)
 
+# Result item keys per Paper field, in priority order (tools name the same field differently)
+_TITLE_KEYS = ("title", "briefTitle")
+_ABSTRACT_KEYS = ("abstract", "summary", "snippet", "description")
+_URL_KEYS = ("url", "link", "doi", "hyperlink")
+_DATE_KEYS = ("year", "date", "pubYear", "publication_date", "publicationDate")
+_JOURNAL_KEYS = ("journal", "venue", "source")
 
-def extract_papers_from_run_result(result: RunResult) -> List[Paper]:
+# Per-source paper lists in multi-source results, with the source name their papers get
+_SOURCE_LISTS = (
+    ("semantic_scholar", "Semantic Scholar"),
+    ("crossref", "CrossRef"),
+    ("biorxiv", "bioRxiv"),
+    ("medrxiv", "medRxiv"),
+)
+
+
+def _first(item: Dict[str, Any], keys: tuple) -> Any:
+    """First truthy value among keys, or None"""
+    for key in keys:
+        value = item.get(key)
+        if value:
+            return value
+    return None
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern a repeated metadata string (source, journal) so papers share one copy"""
+    # AIDEV-NOTE: The set of journal/venue names is small and repeats across hundreds of results
+    return sys.intern(value) if value else value
+
+
+def _as_int(value: Any) -> int:
+    """Coerce a raw citation count to int, 0 when missing or malformed"""
+    if isinstance(value, int):
+        return value
+    return int(value) if isinstance(value, str) and value.isdigit() else 0
+
+
+def extract_run_output(result: RunResult) -> Tuple[List[Paper], List[Dict[str, Any]]]:
     """
-    Extract all papers from an SDK RunResult.
+    Single pass over a run's items collecting unique papers and a basic tool calls summary.
     
     Args:
         result: The RunResult from SDK Runner
         
     Returns:
-        List of Paper objects
+        (papers, tool_calls)
     """
-    all_papers = []
+    # AIDEV-NOTE: Deduplicated as papers are extracted - only unique papers are ever collected
+    seen = set()
+    papers = []
+    tool_calls = []
     
-    # Iterate through all items in the result
     for item in result.new_items:
         if isinstance(item, ToolCallOutputItem):
-            # Extract papers from tool outputs
-            papers = extract_papers_from_tool_output(item.output)
-            all_papers.extend(papers)
+            for paper in extract_papers_from_tool_output(item.output):
+                key = paper.dedup_key
+                if key not in seen:
+                    seen.add(key)
+                    papers.append(paper)
+        elif isinstance(item, ToolCallItem):
+            # AIDEV-NOTE: The tool name lives on the item's raw_item (the model's function call)
+            tool_calls.append({
+                "tool": getattr(item.raw_item, "name", "unknown"),
+                "query": "SDK managed",
+                "papers_found": 0
+            })
     
-    # Deduplicate papers
-    return deduplicate_papers(all_papers)
+    return papers, tool_calls
 
 
 def extract_papers_from_tool_output(output: str) -> List[Paper]:
@@ -50,16 +99,23 @@ def extract_papers_from_tool_output(output: str) -> List[Paper]:
     papers = []
     
     try:
-        # Find JSON in the output - look for RAW JSON DATA section
-        if "=== RAW JSON DATA ===" in output:
-            json_start = output.find("{", output.find("=== RAW JSON DATA ==="))
+        # Raw result passed out of band by sdk_tools.format_tool_result
+        # AIDEV-NOTE: The token trails the output, so rpartition finds it scanning from the end
+        _, sep, token = output.rpartition(RAW_RESULT_TOKEN_MARKER)
+        if sep:
+            token = token.strip()
+            data = pop_raw_result(token)
+            if data is not None:
+                return extract_papers_from_results(data)
+            logger.warning("Raw result for tool output token %s no longer available", token)
+        
+        # Find JSON in the output - look for RAW JSON DATA section (one scan for marker and brace)
+        _, sep, rest = output.partition("=== RAW JSON DATA ===")
+        if sep:
+            json_start = rest.find("{")
             if json_start > -1:
-                # Find the end of JSON (before next section or end of string)
-                json_end = len(output)
-                json_str = output[json_start:json_end].strip()
-                
-                # Parse JSON
-                data = json.loads(json_str)
+                # JSON runs to the end of the output; surrounding whitespace is valid JSON
+                data = fast_json.loads(rest[json_start:])
                 
                 # Extract papers based on the data structure
                 papers.extend(extract_papers_from_results(data))
@@ -86,34 +142,17 @@ def extract_papers_from_results(data: Dict[str, Any]) -> List[Paper]:
         # Handle different result formats
         if "results" in data:
             # Standard format (PubMed, Google Academic, etc.)
+            # One interned source string shared by every paper of this output
+            source = _intern(as_str(data.get("source", "Unknown")))
             for item in data.get("results", []):
-                paper = create_paper_from_item(item, data.get("source", "Unknown"))
-                if paper:
-                    papers.append(paper)
-        
-        if "semantic_scholar" in data:
-            # search_papers format
-            for item in data.get("semantic_scholar", []):
-                paper = create_paper_from_item(item, "Semantic Scholar")
-                if paper:
-                    papers.append(paper)
-        
-        if "crossref" in data:
-            for item in data.get("crossref", []):
-                paper = create_paper_from_item(item, "CrossRef")
+                paper = create_paper_from_item(item, source)
                 if paper:
                     papers.append(paper)
         
-        if "biorxiv" in data:
-            # Preprints format
-            for item in data.get("biorxiv", []):
-                paper = create_paper_from_item(item, "bioRxiv")
-                if paper:
-                    papers.append(paper)
-        
-        if "medrxiv" in data:
-            for item in data.get("medrxiv", []):
-                paper = create_paper_from_item(item, "medRxiv")
+        # search_papers (semantic_scholar/crossref) and preprints (biorxiv/medrxiv) formats
+        for key, source in _SOURCE_LISTS:
+            for item in data.get(key) or ():
+                paper = create_paper_from_item(item, source)
                 if paper:
                     papers.append(paper)
         
@@ -143,7 +182,7 @@ def create_paper_from_item(item: Dict[str, Any], source: str) -> Optional[Paper]
     """
     try:
         # Extract title
-        title = item.get("title") or item.get("briefTitle") or ""
+        title = as_str(_first(item, _TITLE_KEYS)) or ""
         if not title:
             return None
         
@@ -151,39 +190,23 @@ def create_paper_from_item(item: Dict[str, Any], source: str) -> Optional[Paper]
         authors = extract_authors(item)
         
         # Extract abstract
-        abstract = (
-            item.get("abstract") or 
-            item.get("summary") or 
-            item.get("snippet") or 
-            item.get("description") or 
-            ""
-        )
+        abstract = as_str(_first(item, _ABSTRACT_KEYS)) or ""
         
         # Extract URL
-        url = (
-            item.get("url") or 
-            item.get("link") or 
-            item.get("doi") or 
-            item.get("hyperlink") or 
-            ""
-        )
+        url = as_str(_first(item, _URL_KEYS)) or ""
         
         # Extract publication date
-        publication_date = parse_date(
-            item.get("year") or 
-            item.get("date") or 
-            item.get("pubYear") or 
-            item.get("publication_date") or
-            item.get("publicationDate")
-        )
+        publication_date = parse_year_date(_first(item, _DATE_KEYS))
         
         # Extract other fields
-        doi = item.get("doi")
-        journal = item.get("journal") or item.get("venue") or item.get("source")
-        citations = item.get("citations", 0)
+        doi = as_str(item.get("doi"))
+        journal = _intern(as_str(_first(item, _JOURNAL_KEYS)))
+        citations = _as_int(item.get("citations", 0))
         
         # Create Paper object
-        return Paper(
+        # AIDEV-NOTE: model_construct skips Pydantic validation; every field is coerced to its
+        # declared type above, so keep it that way when editing
+        return Paper.model_construct(
             title=title,
             abstract=abstract,
             authors=authors[:10],  # Limit to 10 authors
@@ -211,7 +234,7 @@ def create_paper_from_semantic_scholar(item: Dict[str, Any]) -> Optional[Paper]:
         Paper object or None
     """
     try:
-        title = item.get("title", "")
+        title = as_str(item.get("title")) or ""
         if not title:
             return None
         
@@ -220,28 +243,29 @@ def create_paper_from_semantic_scholar(item: Dict[str, Any]) -> Optional[Paper]:
         for author in item.get("authors", []):
             if isinstance(author, dict):
                 name = author.get("name", "")
-                if name:
+                if name and isinstance(name, str):
                     authors.append(name)
         
         # Extract other fields
-        abstract = item.get("abstract", "")
+        abstract = as_str(item.get("abstract")) or ""
         year = item.get("year")
-        publication_date = parse_date(year)
+        publication_date = parse_year_date(year)
         
         # Build URL
         paper_id = item.get("paperId")
         url = f"https://www.semanticscholar.org/paper/{paper_id}" if paper_id else ""
         
-        return Paper(
+        # Fields coerced as in create_paper_from_item, see the note there
+        return Paper.model_construct(
             title=title,
             abstract=abstract,
             authors=authors[:10],
-            citations=item.get("citationCount", 0),
+            citations=_as_int(item.get("citationCount", 0)),
             publication_date=publication_date,
             hyperlink=url,
             source="Semantic Scholar",
-            doi=item.get("doi"),
-            journal=item.get("venue")
+            doi=as_str(item.get("doi")),
+            journal=_intern(as_str(item.get("venue")))
         )
     
     except Exception as e:
@@ -265,45 +289,8 @@ def extract_authors(item: Dict[str, Any]) -> List[str]:
             elif isinstance(author, dict):
                 # Extract name from dict
                 name = author.get("name") or author.get("authorName") or ""
-                if name:
+                if name and isinstance(name, str):
                     result.append(name)
         return result
     else:
         return []
-
-
-def parse_date(date_value: Any) -> Optional[datetime]:
-    """Parse various date formats"""
-    if not date_value:
-        return None
-    
-    try:
-        if isinstance(date_value, int):
-            # Year only
-            return datetime(date_value, 1, 1)
-        elif isinstance(date_value, str):
-            # Try to extract year
-            import re
-            year_match = re.search(r'\d{4}', str(date_value))
-            if year_match:
-                return datetime(int(year_match.group()), 1, 1)
-    except:
-        pass
-    
-    return None
-
-
-def deduplicate_papers(papers: List[Paper]) -> List[Paper]:
-    """Remove duplicate papers based on title and DOI"""
-    seen = set()
-    unique = []
-    
-    for paper in papers:
-        # Create unique key
-        key = (paper.title.lower(), paper.doi) if paper.doi else paper.title.lower()
-        
-        if key not in seen:
-            seen.add(key)
-            unique.append(paper)
-    
-    return unique
\ No newline at end of file
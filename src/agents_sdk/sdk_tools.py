@@ -3,14 +3,42 @@
 Tool functions for the OpenAI Agents SDK implementation.
 These are decorated versions of our existing search tools that return string outputs.
 """
-import json
+import uuid
 import logging
-from typing import Optional
+from contextvars import ContextVar, Token
+from typing import Dict, Optional
 from agents import function_tool
 from src.tools import search_tools
 
 logger = logging.getLogger(__name__)
 
+# AIDEV-NOTE: Raw result dicts are handed to paper_extractor out of band, keyed by a token embedded
+# in the tool output, instead of being dumped as JSON and parsed back. The stash belongs to the
+# current run (tool tasks inherit the context) and is discarded when the run ends, so nothing is
+# evicted while a run may still extract it and nothing outlives the run.
+RAW_RESULT_TOKEN_MARKER = "=== RAW JSON TOKEN ==="
+_run_results: ContextVar[Optional[Dict[str, dict]]] = ContextVar("sdk_run_results", default=None)
+
+
+def open_result_stash() -> Token:
+    """Start a raw-result stash for the current run; pass the return value to close_result_stash"""
+    return _run_results.set({})
+
+
+def close_result_stash(reset_token: Token):
+    """Drop everything the run stashed and restore the previous stash"""
+    stash = _run_results.get()
+    if stash:
+        stash.clear()
+    _run_results.reset(reset_token)
+
+
+def pop_raw_result(token: str) -> Optional[dict]:
+    """Take the raw result dict stashed by format_tool_result, or None if it's gone"""
+    stash = _run_results.get()
+    return stash.pop(token, None) if stash is not None else None
+
+
 # Helper function to format tool results as strings
 def format_tool_result(result: dict, tool_name: str) -> str:
     """Format tool results for SDK consumption - INCLUDE FULL ABSTRACTS"""
@@ -30,16 +58,29 @@ def format_tool_result(result: dict, tool_name: str) -> str:
             total_results += len(result.get("biorxiv", []))
             total_results += len(result.get("medrxiv", []))
             sources.extend(["bioRxiv", "medRxiv"])
+        elif "data" in result:
+            # search_by_topic returns the raw Semantic Scholar response
+            total_results = len(result.get("data") or [])
+            sources.append("Semantic Scholar")
         
-        # Create detailed output with abstracts prominently displayed
-        output = f"=== SEARCH RESULTS: {tool_name} ===\n"
-        output += f"Total papers found: {total_results}\n"
-        output += f"Sources: {', '.join(sources) if sources else tool_name}\n\n"
+        # Errors are only visible to the agent through this text
+        error_line = f"ERROR: {result['error']}\n" if result.get("error") else ""
         
-        # Add papers with full abstracts
-        output += "=== DETAILED PAPER INFORMATION WITH ABSTRACTS ===\n\n"
+        # Nothing to list or extract - skip the paper section and raw-result stash
+        if total_results == 0:
+            return f"=== SEARCH RESULTS: {tool_name} ===\nTotal papers found: 0\n{error_line}No matching papers.\n"
+        
+        # Create detailed output with abstracts prominently displayed
+        # AIDEV-NOTE: Collected as parts and joined once - up to 50 full abstracts and text previews
+        parts = [
+            f"=== SEARCH RESULTS: {tool_name} ===\n",
+            f"Total papers found: {total_results}\n",
+            error_line,
+            f"Sources: {', '.join(sources) if sources else tool_name}\n\n",
+            # Add papers with full abstracts
+            "=== DETAILED PAPER INFORMATION WITH ABSTRACTS ===\n\n"
+        ]
         
-        paper_count = 0
         # Handle different result formats
         if "results" in result:
             papers = result["results"]
@@ -47,36 +88,43 @@ def format_tool_result(result: dict, tool_name: str) -> str:
             papers = result["semantic_scholar"] + result["crossref"]
         elif "biorxiv" in result:
             papers = result["biorxiv"] + result["medrxiv"]
+        elif "data" in result:
+            papers = result["data"]
         else:
             papers = []
         
-        for paper in papers[:50]:  # Include up to 50 papers
-            paper_count += 1
-            output += f"\n--- PAPER {paper_count} ---\n"
-            output += f"TITLE: {paper.get('title', 'No title')}\n"
-            output += f"AUTHORS: {paper.get('authors', 'No authors')}\n"
-            output += f"YEAR: {paper.get('year', paper.get('date', 'Unknown'))}\n"
-            output += f"SOURCE: {paper.get('source', tool_name)}\n"
+        for paper_count, paper in enumerate(papers[:50], 1):  # Include up to 50 papers
+            parts.append(f"\n--- PAPER {paper_count} ---\n")
+            parts.append(f"TITLE: {paper.get('title', 'No title')}\n")
+            parts.append(f"AUTHORS: {paper.get('authors', 'No authors')}\n")
+            parts.append(f"YEAR: {paper.get('year', paper.get('date', 'Unknown'))}\n")
+            parts.append(f"SOURCE: {paper.get('source', tool_name)}\n")
             
             # FULL ABSTRACT
             abstract = paper.get('abstract', 'No abstract available')
-            output += f"\nFULL ABSTRACT:\n{abstract}\n"
+            parts.append(f"\nFULL ABSTRACT:\n{abstract}\n")
             
             # If full text is available
             if paper.get('has_full_text'):
-                output += f"\nFULL TEXT AVAILABLE: YES (PDF URL: {paper.get('pdf_url', 'N/A')})\n"
-                full_text = paper.get('full_text', '')
+                parts.append(f"\nFULL TEXT AVAILABLE: YES (PDF URL: {paper.get('pdf_url', 'N/A')})\n")
+                full_text = paper.get('full_text') or ''
                 # Include first 1000 chars of full text
-                output += f"FULL TEXT PREVIEW:\n{full_text[:1000]}...\n" if len(full_text) > 1000 else f"FULL TEXT:\n{full_text}\n"
+                if len(full_text) > 1000:
+                    parts.append(f"FULL TEXT PREVIEW:\n{full_text[:1000]}...\n")
+                else:
+                    parts.append(f"FULL TEXT:\n{full_text}\n")
             
-            output += f"\nDOI: {paper.get('doi', 'N/A')}\n"
-            output += "-" * 80 + "\n"
+            parts.append(f"\nDOI: {paper.get('doi', 'N/A')}\n")
+            parts.append("-" * 80 + "\n")
         
-        # Also include the raw JSON for completeness
-        output += "\n\n=== RAW JSON DATA ===\n"
-        output += json.dumps(result, indent=2, ensure_ascii=False)
+        # Reference to the raw result for paper extraction (only within a run that will collect it)
+        stash = _run_results.get()
+        if stash is not None:
+            token = uuid.uuid4().hex
+            stash[token] = result
+            parts.append(f"\n\n{RAW_RESULT_TOKEN_MARKER}\n{token}\n")
         
-        return output
+        return "".join(parts)
     except Exception as e:
         logger.error(f"Error formatting {tool_name} results: {e}")
         return f"Error processing {tool_name} results: {str(e)}"
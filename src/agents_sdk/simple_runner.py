@@ -3,11 +3,13 @@
 Simplified runner for the Bio Agent workflow without complex streaming.
 This gets the basic SDK implementation working first.
 """
+import asyncio
 import logging
 from typing import Optional, Callable
 from agents import Runner
 from src.agents_sdk.bio_agents import bioresearcher, bioanalyser, summarizer
-from src.agents_sdk.paper_extractor import extract_papers_from_run_result
+from src.agents_sdk.paper_extractor import extract_run_output
+from src.agents_sdk.sdk_tools import open_result_stash, close_result_stash
 # Removed handoff_manager dependency
 from src.models.search import SearchResult
 
@@ -35,6 +37,8 @@ async def run_bio_agent_workflow_simple(
     if progress_callback:
         await progress_callback("Starting research with SDK agents...", 10)
     
+    # Raw tool results stashed during this run are only needed until papers are collected
+    stash_token = open_result_stash()
     try:
         # Run the SDK workflow
         # This will automatically handle:
@@ -53,8 +57,11 @@ async def run_bio_agent_workflow_simple(
         if progress_callback:
             await progress_callback("Extracting papers from results...", 80)
         
-        # Extract papers from the run result
-        papers = extract_papers_from_run_result(result)
+        # Extract papers and the tool calls summary from the run result
+        # AIDEV-NOTE: CPU-bound (paper construction, legacy JSON parsing) - run in a worker
+        # thread so other searches' WebSocket traffic isn't stalled behind it
+        papers, tool_calls = await asyncio.to_thread(extract_run_output, result)
+        tool_count = len(tool_calls)
         
         if progress_callback:
             await progress_callback("Formatting final results...", 90)
@@ -62,20 +69,6 @@ async def run_bio_agent_workflow_simple(
         # Get the final output (should be from Summarizer)
         final_analysis = str(result.final_output)
         
-        # Create basic tool calls summary
-        tool_calls = []
-        tool_count = 0
-        
-        # Count items that look like tool calls
-        for item in result.new_items:
-            if hasattr(item, 'tool_name'):
-                tool_count += 1
-                tool_calls.append({
-                    "tool": getattr(item, 'tool_name', 'unknown'),
-                    "query": "SDK managed",
-                    "papers_found": 0  # Will be calculated below
-                })
-        
         if progress_callback:
             await progress_callback("Research complete!", 100)
         
@@ -87,9 +80,10 @@ async def run_bio_agent_workflow_simple(
             analysis=final_analysis,
             raw_data={"sdk_result": "completed", "total_items": len(result.new_items)},
             tool_calls=tool_calls,
+            # AIDEV-NOTE: SearchResult.reasoning_trace holds dicts; plain strings fail validation
             reasoning_trace=[
-                f"SDK workflow completed with {len(result.new_items)} total items",
-                f"Final output from: {result.new_items[-1].__class__.__name__ if result.new_items else 'unknown'}"
+                {"reasoning": f"SDK workflow completed with {len(result.new_items)} total items"},
+                {"reasoning": f"Final output from: {result.new_items[-1].__class__.__name__ if result.new_items else 'unknown'}"}
             ]
         )
         
@@ -106,5 +100,7 @@ async def run_bio_agent_workflow_simple(
             analysis=f"Search failed due to an error: {str(e)}",
             raw_data={"error": str(e)},
             tool_calls=[],
-            reasoning_trace=[f"Error occurred: {str(e)}"]
-        )
\ No newline at end of file
+            reasoning_trace=[{"reasoning": f"Error occurred: {str(e)}"}]
+        )
+    finally:
+        close_result_stash(stash_token)
\ No newline at end of file
@@ -1,7 +1,11 @@
 # AIDEV-SECTION: Paper Metadata Models
+import re
+from functools import cached_property
 from typing import List, Optional
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, field_serializer
+
+_WHITESPACE_RE = re.compile(r"\s+")
 
 class Paper(BaseModel):
     """Paper metadata for frontend display"""
@@ -15,8 +19,40 @@ class Paper(BaseModel):
     doi: Optional[str] = None
     journal: Optional[str] = None  # Journal or venue name
     
-    class Config:
-        # AIDEV-NOTE: Use Pydantic's built-in JSON encoders for datetime
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
\ No newline at end of file
+    @cached_property
+    def dedup_key(self) -> str:
+        """Key identifying duplicate papers: the DOI when present, else the normalized title"""
+        # AIDEV-NOTE: Shared by every dedup site so the legacy and SDK paths agree on duplicates;
+        # computed once per paper however many dedup passes it goes through. A DOI alone identifies
+        # the paper, so sources that format its title differently still collapse to one entry
+        if self.doi:
+            return "doi:" + self.doi.strip().lower()
+        return "title:" + _WHITESPACE_RE.sub(" ", self.title.strip().casefold())
+    
+    @cached_property
+    def summary_block(self) -> str:
+        """Paper entry for the summarizer prompt, without its list number"""
+        authors_str = ", ".join(self.authors[:3]) + " et al." if self.authors else "Unknown"
+        pub_date = self.publication_date.strftime("%Y-%m") if self.publication_date else "Unknown date"
+        
+        return f"""{self.title}
+   Authors: {authors_str}
+   Source: {self.source} | Published: {pub_date} | Citations: {self.citations}
+   Abstract: {self.abstract[:500]}{"..." if len(self.abstract) > 500 else ""}
+   Link: {self.hyperlink}
+"""
+    
+    @cached_property
+    def summary_block_short(self) -> str:
+        """One-line paper entry for the fallback summary, without its list number"""
+        authors = ", ".join(self.authors[:2]) + " et al." if len(self.authors) > 2 else ", ".join(self.authors)
+        return f"{self.title} - {authors} ({self.source})"
+    
+    @field_serializer("publication_date", when_used="json-unless-none")
+    def serialize_publication_date(self, value: datetime) -> str:
+        """JSON dates as plain isoformat(), the format the frontend already parses"""
+        return value.isoformat()
+    
+    # AIDEV-NOTE: Frozen - papers are shared between results, caches and callbacks, and
+    # dedup_key/summary_block are cached from the fields, so they must not change after creation
+    model_config = ConfigDict(frozen=True)
\ No newline at end of file
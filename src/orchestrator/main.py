@@ -11,18 +11,30 @@
 # - Ensure single worker mode for WebSocket compatibility
 # - Proper ping/pong intervals configured (20s ping, 10s timeout)
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Response, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 import logging
 import asyncio
+import time
 import uuid
 from datetime import datetime
 from typing import Dict
-import json
 
 from src.models.search import SearchRequest, SearchResult
 from src.agents.search_agent import SearchAgent
-from src.utils.websocket_manager import ws_manager
+from src.utils.websocket_manager import ws_manager, utc_timestamp
+from src.utils import fast_json
+from src.utils.log_queue import setup_queue_logging
+from src.utils.event_loop import enable_eager_tasks, UVICORN_LOOP
+from src.agents.openai_client import warm_up
+
+# AIDEV-NOTE: PDF downloads are disabled (see search_tools) and PyPDF2 is not in requirements.txt,
+# so the downloader's pooled client is only opened/closed here when the module imports
+try:
+    from src.tools import pdf_downloader
+except ImportError:
+    pdf_downloader = None
 
 # Setup
 app = FastAPI(title="Bio Agent API", version="1.0.0")
@@ -38,31 +50,72 @@ app.add_middleware(
     expose_headers=["*"]
 )
 
+# AIDEV-NOTE: Compresses large HTTP bodies (completed /task/{task_id} results with abstracts)
+# for clients that accept gzip; WebSocket traffic passes through untouched
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Configure logging
+# AIDEV-NOTE: Handlers run on a QueueListener thread so log I/O never blocks the event loop
 logging.basicConfig(level=logging.INFO)
+setup_queue_logging()
 logger = logging.getLogger(__name__)
 
 # Initialize agents lazily
+# AIDEV-NOTE: Construction runs in a worker thread so it doesn't stall the event loop; the lock
+# makes searches arriving meanwhile wait for that one agent instead of building their own
 search_agent = None
+_agent_lock = asyncio.Lock()
 
-def get_search_agent():
+async def get_search_agent():
     global search_agent
     if search_agent is None:
-        try:
-            logger.info("Initializing SearchAgent...")
-            search_agent = SearchAgent()
-            logger.info("SearchAgent initialized successfully")
-        except Exception as e:
-            logger.error(f"Failed to initialize SearchAgent: {e}", exc_info=True)
-            raise RuntimeError(f"SearchAgent initialization failed: {str(e)}")
+        async with _agent_lock:
+            if search_agent is None:
+                try:
+                    logger.info("Initializing SearchAgent...")
+                    search_agent = await asyncio.to_thread(SearchAgent)
+                    logger.info("SearchAgent initialized successfully")
+                except Exception as e:
+                    logger.error(f"Failed to initialize SearchAgent: {e}", exc_info=True)
+                    raise RuntimeError(f"SearchAgent initialization failed: {str(e)}")
     return search_agent
 
 # Active tasks tracking
+# AIDEV-NOTE: Entries hold the full SearchResult, so they can't live forever: a finished task is
+# dropped TASK_TTL_SECONDS after completion (long enough to poll /task/{task_id}), and beyond
+# MAX_TASKS entries the oldest is evicted, in progress or not
+TASK_TTL_SECONDS = 3600
+MAX_TASKS = 1000
 active_tasks: Dict[str, Dict] = {}
 
+# Reference held so the warm-up task isn't garbage collected mid-flight
+warmup_task = None
+
+@app.on_event("startup")
+async def startup():
+    global warmup_task
+    enable_eager_tasks()
+    # References to running searches, created once here rather than checked for on every request
+    app.state.background_tasks = set()
+    # AIDEV-NOTE: Runs in the background so a slow or unreachable endpoint doesn't delay startup
+    warmup_task = asyncio.create_task(warm_up())
+    if pdf_downloader:
+        pdf_downloader.open_client()
+
+@app.on_event("shutdown")
+async def shutdown():
+    if pdf_downloader:
+        await pdf_downloader.close_client()
+
+# AIDEV-NOTE: Constant frames/bodies are serialized once at import
+_HEALTH_BODY = b'{"status":"healthy"}'
+_PONG = "pong"
+_CONNECTED_PREFIX = '{"type":"connected","data":{"task_id":'
+_CONNECTED_MIDDLE = ',"message":"WebSocket connected successfully"},"timestamp":"'
+
 @app.get("/health")
-def health():
-    return {"status": "healthy"}
+async def health():
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 @app.get("/debug/config")
 def debug_config():
@@ -144,15 +197,16 @@ async def search(request: SearchRequest) -> Dict:
                 "query": request.query,
                 "started_at": datetime.utcnow()
             }
+            while len(active_tasks) > MAX_TASKS:
+                # Dicts keep insertion order, so the first key is the oldest task
+                active_tasks.pop(next(iter(active_tasks)))
             
             # Start search in background with proper error handling
             task = asyncio.create_task(execute_search(task_id, request))
             
             # Store the task reference to prevent garbage collection
-            if not hasattr(app.state, "background_tasks"):
-                app.state.background_tasks = set()
             app.state.background_tasks.add(task)
-            task.add_done_callback(lambda t: app.state.background_tasks.discard(t))
+            task.add_done_callback(app.state.background_tasks.discard)
             
             return {
                 "task_id": task_id,
@@ -166,8 +220,13 @@ async def search(request: SearchRequest) -> Dict:
         # AIDEV-NOTE: Return more informative error for debugging
         raise HTTPException(500, f"Search initiation failed: {str(e)}")
 
+# Window over which streamed summary chunks are coalesced into one frame
+STREAM_FLUSH_DELAY = 0.05
+
 async def execute_search(task_id: str, request: SearchRequest):
     """Execute search and send updates via WebSocket"""
+    # Held directly so an eviction from active_tasks mid-search can't raise KeyError here
+    task_info = active_tasks[task_id]
     try:
         logger.info(f"Starting search for task {task_id}: {request.query}")
         
@@ -196,13 +255,20 @@ async def execute_search(task_id: str, request: SearchRequest):
         
         logger.info(f"Executing search agent for: {request.query}")
         
-        # Create a keep-alive task to prevent timeouts
-        keep_alive_event = asyncio.Event()
-        keep_alive_task = asyncio.create_task(keep_alive_updates(task_id, keep_alive_event))
+        task_info["last_progress_at"] = time.monotonic()
         
         # Create progress callback
+        # AIDEV-NOTE: A repeat of the last (progress, message) is dropped - it tells the client
+        # nothing and doesn't count as progress for the keep-alive deadline
+        last_progress_sent = None
+        
         async def progress_callback(message: str, progress: int):
+            nonlocal last_progress_sent
+            if (progress, message) == last_progress_sent:
+                return
+            last_progress_sent = (progress, message)
             try:
+                task_info["last_progress_at"] = time.monotonic()
                 await send_ws_update(task_id, "progress", {
                     "progress": progress,
                     "current_step": message,
@@ -212,33 +278,44 @@ async def execute_search(task_id: str, request: SearchRequest):
                 logger.warning(f"Failed to send progress update: {e}")
         
         # Create paper callback for streaming papers as they're found
+        # AIDEV-NOTE: Each paper is streamed at most once per task - the additional phase
+        # often re-finds initial papers, and the frontend appends what it receives
+        papers_sent = task_info["papers_sent"] = set()
+        
         async def paper_callback(papers: list, phase: str):
             try:
                 logger.info(f"Paper callback called with {len(papers)} papers for phase: {phase}")
                 
-                # Convert Paper objects to dicts
-                paper_dicts = []
-                for paper in papers:
-                    if hasattr(paper, 'dict'):
-                        paper_dicts.append(paper.dict())
-                    else:
-                        paper_dicts.append(paper)
+                new_papers = [p for p in papers if p.dedup_key not in papers_sent]
+                if not new_papers:
+                    logger.info(f"No new papers to send for task {task_id} in {phase} phase")
+                    return
+                papers_sent.update(p.dedup_key for p in new_papers)
                 
-                logger.info(f"Sending {len(paper_dicts)} papers via WebSocket for task {task_id}")
+                logger.info(f"Sending {len(new_papers)} papers via WebSocket for task {task_id}")
                 
                 await send_ws_update(task_id, "papers", {
-                    "papers": paper_dicts,
+                    "papers": new_papers,
                     "phase": phase,  # "initial" or "additional"
-                    "count": len(paper_dicts),
-                    "message": f"Found {len(paper_dicts)} papers in {phase} search"
+                    "count": len(new_papers),
+                    "message": f"Found {len(new_papers)} papers in {phase} search"
                 })
                 
                 logger.info(f"Successfully sent papers update for task {task_id}")
             except Exception as e:
-                logger.error(f"Failed to send paper update: {e}", exc_info=True)
+                logger.warning(f"Failed to send paper update: {e!r}")
         
         # Create stream callback for summary streaming
-        async def stream_callback(chunk: str):
+        # AIDEV-NOTE: Chunks arriving within STREAM_FLUSH_DELAY of the first buffered one go out
+        # as a single summary_stream frame; the tail is flushed before the result frame
+        stream_parts = []
+        stream_flush_task = None
+        
+        async def flush_stream():
+            if not stream_parts:
+                return
+            chunk = "".join(stream_parts)
+            stream_parts.clear()
             try:
                 await send_ws_update(task_id, "summary_stream", {
                     "chunk": chunk,
@@ -247,43 +324,59 @@ async def execute_search(task_id: str, request: SearchRequest):
             except Exception as e:
                 logger.warning(f"Failed to send stream update: {e}")
         
+        async def flush_stream_later():
+            nonlocal stream_flush_task
+            await asyncio.sleep(STREAM_FLUSH_DELAY)
+            stream_flush_task = None
+            await flush_stream()
+        
+        async def stream_callback(chunk: str):
+            nonlocal stream_flush_task
+            stream_parts.append(chunk)
+            if stream_flush_task is None:
+                stream_flush_task = asyncio.create_task(flush_stream_later())
+        
         # Execute search with progress callback and timeout
         # AIDEV-NOTE: Increased timeout to 300 seconds (5 minutes) for complex searches
-        agent = get_search_agent()
-        result = await asyncio.wait_for(
-            agent.execute(request.query, progress_callback, paper_callback, stream_callback),
-            timeout=300.0  # 5 minute timeout
-        )
+        agent = await get_search_agent()
+        
+        # Create a keep-alive task to prevent timeouts
+        # AIDEV-NOTE: It runs only while the agent does - the finally cancels it however the
+        # call ends (result, timeout or error), so no branch below has to stop it. A pending
+        # stream flush is cancelled there too: on failure no summary_stream frame may follow
+        # the error frame, and on success the tail is flushed explicitly below
+        keep_alive_task = asyncio.create_task(keep_alive_updates(task_id, task_info))
+        try:
+            result = await asyncio.wait_for(
+                agent.execute(request.query, progress_callback, paper_callback, stream_callback),
+                timeout=300.0  # 5 minute timeout
+            )
+        finally:
+            keep_alive_task.cancel()
+            if stream_flush_task is not None:
+                stream_flush_task.cancel()
         
         logger.info(f"Search completed for task {task_id}")
         
-        # Stop keep-alive updates
-        keep_alive_event.set()
-        await keep_alive_task
+        await flush_stream()
         
         # Store result
-        active_tasks[task_id]["result"] = result
-        active_tasks[task_id]["status"] = "completed"
+        # AIDEV-NOTE: A completed task never changes, so its whole /task/{task_id} response is
+        # serialized once here (off the event loop) and served as-is to every poll. Only the
+        # JSON is kept, not the SearchResult; set before the status flips to completed
+        task_info["response_json"] = await asyncio.to_thread(
+            _completed_task_json, task_id, task_info["query"], result
+        )
+        task_info["status"] = "completed"
         
-        # Send final result - avoid dict() method to prevent mode= errors
+        # Send final result
         logger.info("Preparing result for WebSocket")
-        # AIDEV-NOTE: Manually construct dict to avoid Pydantic version issues
+        # AIDEV-NOTE: raw_data is left out of the frame; Paper objects are serialized by
+        # fast_json (model_dump + native orjson datetimes) when the envelope is sent
         result_data = {
             "query": result.query,
             "analysis": result.analysis,
-            "papers": [
-                {
-                    "title": p.title,
-                    "abstract": p.abstract,
-                    "authors": p.authors,
-                    "citations": p.citations,
-                    "publication_date": p.publication_date.isoformat() if p.publication_date else None,
-                    "hyperlink": p.hyperlink,
-                    "source": p.source,
-                    "doi": p.doi,
-                    "journal": p.journal
-                } for p in result.papers
-            ],
+            "papers": result.papers,
             "tool_calls": result.tool_calls or [],
             "reasoning_trace": result.reasoning_trace or []
         }
@@ -293,27 +386,27 @@ async def execute_search(task_id: str, request: SearchRequest):
         error_msg = "Search timed out after 5 minutes. The query might be too broad or external services are slow."
         logger.error(f"Search timeout for task {task_id}")
         
-        # Stop keep-alive updates
-        keep_alive_event.set()
-        await keep_alive_task
-        
-        active_tasks[task_id]["status"] = "failed"
-        active_tasks[task_id]["error"] = error_msg
+        task_info["status"] = "failed"
+        task_info["error"] = error_msg
         await send_ws_update(task_id, "error", {"error": error_msg})
     except Exception as e:
         logger.error(f"Search execution error for task {task_id}: {e}", exc_info=True)
-        # Stop keep-alive updates if they're running
-        if 'keep_alive_event' in locals():
-            keep_alive_event.set()
-            if 'keep_alive_task' in locals():
-                await keep_alive_task
         
-        active_tasks[task_id]["status"] = "failed"
-        active_tasks[task_id]["error"] = str(e)
+        task_info["status"] = "failed"
+        task_info["error"] = str(e)
         await send_ws_update(task_id, "error", {"error": str(e)})
+    finally:
+        task_info.pop("papers_sent", None)
+        asyncio.get_running_loop().call_later(TASK_TTL_SECONDS, active_tasks.pop, task_id, None)
+
+# Seconds without a progress update before a keep-alive is sent
+KEEP_ALIVE_INTERVAL = 30.0
 
-async def keep_alive_updates(task_id: str, stop_event: asyncio.Event):
-    """Send periodic keep-alive updates to prevent timeout"""
+async def keep_alive_updates(task_id: str, task_info: Dict):
+    """Send a keep-alive update whenever KEEP_ALIVE_INTERVAL passes without real progress.
+    Runs until cancelled."""
+    # AIDEV-NOTE: Deadline-based - each wait runs until KEEP_ALIVE_INTERVAL after the last
+    # progress update (task_info["last_progress_at"]), so an actively reporting search gets none
     last_progress = 10
     messages = [
         "Searching scientific databases...",
@@ -324,66 +417,77 @@ async def keep_alive_updates(task_id: str, stop_event: asyncio.Event):
     ]
     message_index = 0
     
-    while not stop_event.is_set():
-        try:
-            # Wait for 30 seconds or until stopped
-            await asyncio.wait_for(stop_event.wait(), timeout=30.0)
-            if stop_event.is_set():
-                break
-        except asyncio.TimeoutError:
-            # Send a keep-alive progress update
-            last_progress = min(last_progress + 5, 90)  # Gradually increase progress
-            await send_ws_update(task_id, "progress", {
-                "progress": last_progress,
-                "current_step": messages[message_index % len(messages)],
-                "message": "Search in progress..."
-            })
-            message_index += 1
-            logger.debug(f"Sent keep-alive update for task {task_id}")
+    while True:
+        # Wait until the keep-alive deadline
+        idle = time.monotonic() - task_info["last_progress_at"]
+        await asyncio.sleep(max(1.0, KEEP_ALIVE_INTERVAL - idle))
+        if time.monotonic() - task_info["last_progress_at"] < KEEP_ALIVE_INTERVAL:
+            continue  # Real progress arrived meanwhile; wait for the new deadline
+        task_info["last_progress_at"] = time.monotonic()
+        # Send a keep-alive progress update
+        last_progress = min(last_progress + 5, 90)  # Gradually increase progress
+        await send_ws_update(task_id, "progress", {
+            "progress": last_progress,
+            "current_step": messages[message_index % len(messages)],
+            "message": "Search in progress..."
+        })
+        message_index += 1
+        logger.debug("Sent keep-alive update for task %s", task_id)
+
+# Frames carrying more papers than this are serialized off the event loop
+OFFLOAD_PAPER_COUNT = 20
 
 async def send_ws_update(task_id: str, msg_type: str, data: Dict):
-    """Send update via WebSocket if connected"""
-    # AIDEV-NOTE: Use json.dumps/loads to ensure proper serialization
-    # This handles any Pydantic v2 models that might use mode='json'
+    """Queue update for the task's WebSocket writer if connected"""
+    # AIDEV-NOTE: The envelope is serialized exactly once with fast_json (orjson), which handles
+    # Pydantic models and datetimes itself - no json.dumps/loads sanitizing round trip.
+    # Nothing here waits on the socket; the connection's writer task does the sending
     try:
-        logger.debug(f"Attempting to send {msg_type} update for task {task_id}")
-        
-        # Convert to JSON string and back to ensure compatibility
-        json_str = json.dumps(data, default=str)
-        safe_data = json.loads(json_str)
+        # AIDEV-NOTE: Runs for every frame - log calls here use lazy %-formatting so nothing is
+        # formatted unless the record is actually emitted
+        logger.debug("Attempting to send %s update for task %s", msg_type, task_id)
         
         # Check if WebSocket is connected
-        if task_id not in ws_manager.active_connections:
-            logger.warning(f"No WebSocket connection for task {task_id}, message type: {msg_type}")
+        if task_id not in ws_manager.send_queues:
+            logger.warning("No WebSocket connection for task %s, message type: %s", task_id, msg_type)
             # AIDEV-NOTE: Store message for later delivery or log for debugging
             # This is expected for the first few messages while connection is being established
             return False
         
-        sent = await ws_manager.send_json(task_id, {
+        # Serialization errors surface here, before anything reaches the queue
+        envelope = {
             "type": msg_type,
-            "data": safe_data,
-            "timestamp": datetime.utcnow().isoformat()
-        })
+            "data": data,
+            "timestamp": utc_timestamp()
+        }
+        # AIDEV-NOTE: Large paper lists (result and papers frames) take tens of ms of pure CPU to
+        # serialize, so they're encoded in a worker thread while other tasks' updates keep flowing.
+        # Frames sent meanwhile may overtake them
+        papers = data.get("papers")
+        if papers is not None and len(papers) > OFFLOAD_PAPER_COUNT:
+            message = await asyncio.to_thread(fast_json.dumps, envelope)
+        else:
+            message = fast_json.dumps(envelope)
+        # Progress updates are superseded by the next one, so they may be dropped under backlog
+        queued = ws_manager.enqueue(task_id, message, droppable=msg_type == "progress")
         
-        if sent:
-            logger.debug(f"Successfully sent {msg_type} update for task {task_id}")
+        if queued:
+            logger.debug("Queued %s update for task %s", msg_type, task_id)
         else:
-            logger.warning(f"Failed to send {msg_type} update for task {task_id}")
+            logger.warning("Dropped %s update for task %s", msg_type, task_id)
             
-        return sent
+        return queued
             
     except Exception as e:
-        logger.error(f"Error in send_ws_update: {e}", exc_info=True)
+        # AIDEV-NOTE: No traceback - when a connection degrades every frame can fail here, and
+        # formatting a traceback per frame would slow the loop further
+        logger.warning("Error in send_ws_update: %r", e)
         # Try to send error notification only if connection exists
-        if task_id in ws_manager.active_connections:
-            try:
-                await ws_manager.send_json(task_id, {
-                    "type": "error",
-                    "data": {"error": str(e)},
-                    "timestamp": datetime.utcnow().isoformat()
-                })
-            except:
-                pass  # Avoid recursive errors
+        ws_manager.enqueue(task_id, fast_json.dumps({
+            "type": "error",
+            "data": {"error": str(e)},
+            "timestamp": utc_timestamp()
+        }))
         return False
 
 @app.websocket("/ws/{task_id}")
@@ -395,35 +499,33 @@ async def websocket_endpoint(websocket: WebSocket, task_id: str):
     await websocket.accept()
     logger.info(f"WebSocket accepted for task {task_id}")
     
+    writer = None
     try:
         # AIDEV-NOTE: Register with manager BEFORE sending any messages
-        # This ensures the connection is available for execute_search to use
+        # This ensures the connection is available for execute_search to use.
+        # All sends for this connection, pongs included, go through its writer task
         ws_manager.active_connections[task_id] = websocket
+        writer = ws_manager.start_writer(task_id, websocket)
         logger.info(f"WebSocket registered for task {task_id}, total connections: {len(ws_manager.active_connections)}")
         
         # Send initial connection confirmation
-        await websocket.send_json({
-            "type": "connected",
-            "data": {"task_id": task_id, "message": "WebSocket connected successfully"},
-            "timestamp": datetime.utcnow().isoformat()
-        })
+        # task_id comes from the URL, so it's still JSON-encoded rather than pasted in
+        ws_manager.enqueue(task_id, f'{_CONNECTED_PREFIX}{fast_json.dumps(task_id)}{_CONNECTED_MIDDLE}{utc_timestamp()}"}}')
         
         logger.info(f"WebSocket ready for task {task_id}, listening for messages...")
         
-        # Keep connection alive
+        # Keep connection alive until the client disconnects
+        # AIDEV-NOTE: Updates only flow server -> client. Protocol-level keep-alive is uvicorn's
+        # ws_ping_interval/ws_ping_timeout; the app-level "ping" text is still answered for
+        # clients that send it, and any other client message is ignored without logging
         while True:
             try:
-                # Wait for messages from client (mainly for ping/pong)
-                data = await websocket.receive_text()
-                logger.debug(f"Received from client for task {task_id}: {data}")
-                
-                # Send pong response if it's a ping
-                if data == "ping":
-                    await websocket.send_text("pong")
-                    
-            except WebSocketDisconnect:
-                logger.info(f"WebSocket disconnected for task {task_id}")
-                break
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    logger.info(f"WebSocket disconnected for task {task_id}")
+                    break
+                if message.get("text") == "ping":
+                    ws_manager.enqueue(task_id, _PONG)
             except Exception as e:
                 logger.error(f"WebSocket error for task {task_id}: {e}")
                 break
@@ -431,8 +533,10 @@ async def websocket_endpoint(websocket: WebSocket, task_id: str):
     except Exception as e:
         logger.error(f"WebSocket connection error for task {task_id}: {e}", exc_info=True)
     finally:
-        # Cleanup
-        if task_id in ws_manager.active_connections:
+        # Cleanup - only what this connection registered; a reconnect may already own task_id
+        if writer:
+            ws_manager.stop_writer(task_id, writer)
+        if ws_manager.active_connections.get(task_id) is websocket:
             del ws_manager.active_connections[task_id]
             logger.info(f"WebSocket cleaned up for task {task_id}, remaining connections: {len(ws_manager.active_connections)}")
 
@@ -441,6 +545,17 @@ async def websocket_status():
     """Get WebSocket connection status"""
     return ws_manager.get_connection_info()
 
+def _completed_task_json(task_id: str, query: str, result: SearchResult) -> str:
+    """Full /task/{task_id} response body for a completed search"""
+    return fast_json.dumps({
+        "task_id": task_id,
+        "status": "completed",
+        "query": query,
+        "result": result,
+        # Include tool calls in the response
+        "tool_calls": result.tool_calls
+    })
+
 @app.get("/task/{task_id}")
 async def get_task_status(task_id: str):
     """Get task status and results"""
@@ -448,17 +563,16 @@ async def get_task_status(task_id: str):
         raise HTTPException(404, "Task not found")
     
     task = active_tasks[task_id]
+    if "response_json" in task:
+        # Response bypasses FastAPI's own serialization
+        return Response(content=task["response_json"], media_type="application/json")
+    
     response = {
         "task_id": task_id,
         "status": task["status"],
         "query": task["query"]
     }
     
-    if "result" in task:
-        result_dict = task["result"].dict()
-        # Include tool calls in the response
-        response["result"] = result_dict
-        response["tool_calls"] = result_dict.get("tool_calls", [])
     if "error" in task:
         response["error"] = task["error"]
     
@@ -471,7 +585,11 @@ if __name__ == "__main__":
         app, 
         host="0.0.0.0", 
         port=8000,
+        loop=UVICORN_LOOP,  # uvloop everywhere but Windows
+        http="auto",  # httptools when installed, h11 otherwise
         # WebSocket settings
+        ws="websockets",
+        ws_per_message_deflate=False,  # Short JSON frames gain little from compression
         ws_ping_interval=20,  # Send ping every 20 seconds
         ws_ping_timeout=10,   # Wait 10 seconds for pong
         # General settings
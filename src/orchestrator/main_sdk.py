@@ -16,6 +16,16 @@ import os
 from src.models.search import SearchRequest, SearchResult
 from src.orchestrator.sdk_search import execute_sdk_search
 from src.utils.websocket_manager import ws_manager
+from src.utils.log_queue import setup_queue_logging
+from src.utils.event_loop import enable_eager_tasks, UVICORN_LOOP
+from src.agents.openai_client import warm_up
+from src.agents_sdk.azure_config import azure_client
+
+# PDF downloader client lifecycle, see main.py
+try:
+    from src.tools import pdf_downloader
+except ImportError:
+    pdf_downloader = None
 
 # Setup
 app = FastAPI(title="Bio Agent API (SDK)", version="2.0.0")
@@ -31,16 +41,36 @@ app.add_middleware(
 )
 
 # Configure logging
+# AIDEV-NOTE: Handlers run on a QueueListener thread so log I/O never blocks the event loop
 logging.basicConfig(level=logging.INFO)
+setup_queue_logging()
 logger = logging.getLogger(__name__)
 
 # Store active tasks
 active_tasks: Dict[str, Dict] = {}
 
+# AIDEV-NOTE: Searches run on a fixed pool of long-lived workers fed by a bounded queue rather
+# than one Task per request; a full queue rejects new searches with 503 instead of piling up
+SEARCH_WORKERS = int(os.getenv("SEARCH_WORKERS", 16))
+SEARCH_QUEUE_SIZE = 256
+search_queue: asyncio.Queue = None
+search_workers = []
+
+# Reference held so the warm-up task isn't garbage collected mid-flight
+warmup_task = None
+
 @app.on_event("startup")
 async def startup():
     """Initialize SDK agents on startup"""
     logger.info("Bio Agent API (SDK) starting up...")
+    global warmup_task, search_queue
+    enable_eager_tasks()
+    # Background pre-connect of the shared SDK client, see main.py
+    warmup_task = asyncio.create_task(warm_up(azure_client))
+    search_queue = asyncio.Queue(maxsize=SEARCH_QUEUE_SIZE)
+    search_workers.extend(asyncio.create_task(search_worker(i)) for i in range(SEARCH_WORKERS))
+    if pdf_downloader:
+        pdf_downloader.open_client()
     # SDK agents are initialized on import, no need for explicit init
     logger.info("SDK agents ready")
 
@@ -48,10 +78,13 @@ async def startup():
 async def shutdown():
     """Cleanup on shutdown"""
     logger.info("Bio Agent API (SDK) shutting down...")
-    # Cancel any active tasks
-    for task_id, task_info in active_tasks.items():
-        if not task_info["task"].done():
-            task_info["task"].cancel()
+    # Cancel the workers, and with them any searches in progress
+    for worker in search_workers:
+        worker.cancel()
+    await asyncio.gather(*search_workers, return_exceptions=True)
+    search_workers.clear()
+    if pdf_downloader:
+        await pdf_downloader.close_client()
 
 @app.get("/")
 async def root():
@@ -73,69 +106,89 @@ async def search(request: SearchRequest) -> Dict:
     # Generate task ID
     task_id = str(uuid.uuid4())
     
-    # Create progress callback for WebSocket updates
-    async def progress_callback(message: str, progress: int):
-        await ws_manager.send_progress(task_id, {
-            "message": message,
-            "progress": progress,
-            "timestamp": datetime.now().isoformat()
-        })
-    
-    # Create search task
-    async def run_search():
-        try:
-            logger.info(f"Starting SDK search for task {task_id}")
-            
-            # Run SDK search with progress updates
-            result = await execute_sdk_search(
-                query=request.query,
-                progress_callback=progress_callback
-            )
-            
-            # Send final result
-            await ws_manager.send_result(task_id, result.model_dump())
-            
-            # Store result
-            active_tasks[task_id]["result"] = result
-            active_tasks[task_id]["status"] = "completed"
-            
-            logger.info(f"Search task {task_id} completed successfully")
-            
-        except Exception as e:
-            logger.error(f"Search task {task_id} failed: {e}", exc_info=True)
-            await ws_manager.send_error(task_id, str(e))
-            active_tasks[task_id]["status"] = "failed"
-            active_tasks[task_id]["error"] = str(e)
-    
-    # Start task
-    task = asyncio.create_task(run_search())
     active_tasks[task_id] = {
-        "task": task,
-        "status": "running",
+        "status": "queued",
         "created_at": datetime.now()
     }
     
+    # Queue the search for the worker pool
+    try:
+        search_queue.put_nowait((task_id, request.query))
+    except asyncio.QueueFull:
+        del active_tasks[task_id]
+        logger.warning(f"Search queue full, rejecting request: {request.query}")
+        raise HTTPException(503, "Too many searches in progress, please retry shortly")
+    
     return {
         "task_id": task_id,
         "status": "started",
         "message": "Search initiated. Connect to WebSocket for real-time updates."
     }
 
+async def search_worker(worker_id: int):
+    """Run queued searches one at a time until cancelled"""
+    while True:
+        task_id, query = await search_queue.get()
+        try:
+            await run_search(task_id, query)
+        except Exception as e:
+            # A failing search must not take its worker down with it
+            logger.error(f"Search worker {worker_id} error for task {task_id}: {e}", exc_info=True)
+        finally:
+            search_queue.task_done()
+
+async def run_search(task_id: str, query: str):
+    """Run one SDK search, reporting progress and the outcome over the task's WebSocket"""
+    # Create progress callback for WebSocket updates
+    async def progress_callback(message: str, progress: int):
+        ws_manager.send_progress(task_id, {
+            "message": message,
+            "progress": progress,
+            "timestamp": datetime.now().isoformat()
+        })
+    
+    try:
+        logger.info(f"Starting SDK search for task {task_id}")
+        active_tasks[task_id]["status"] = "running"
+        
+        # Run SDK search with progress updates
+        result = await execute_sdk_search(
+            query=query,
+            progress_callback=progress_callback
+        )
+        
+        # Send final result
+        ws_manager.send_result(task_id, result)
+        
+        # Store result
+        active_tasks[task_id]["result"] = result
+        active_tasks[task_id]["status"] = "completed"
+        
+        logger.info(f"Search task {task_id} completed successfully")
+        
+    except Exception as e:
+        logger.error(f"Search task {task_id} failed: {e}", exc_info=True)
+        ws_manager.send_error(task_id, str(e))
+        active_tasks[task_id]["status"] = "failed"
+        active_tasks[task_id]["error"] = str(e)
+
 @app.websocket("/ws/{task_id}")
 async def websocket_endpoint(websocket: WebSocket, task_id: str):
     """WebSocket endpoint for real-time search progress"""
     logger.info(f"WebSocket connection attempt for task {task_id}")
     
+    writer = None
     try:
         # Accept connection
         await websocket.accept()
         logger.info(f"WebSocket connected for task {task_id}")
         
-        # Register connection
-        await ws_manager.connect(task_id, websocket)
+        # Register connection; all sends go through its writer task, see main.py
+        ws_manager.active_connections[task_id] = websocket
+        writer = ws_manager.start_writer(task_id, websocket)
         
         # Send initial connection message
-        await ws_manager.send_message(task_id, {
+        ws_manager.send_message(task_id, {
             "type": "connected",
             "task_id": task_id,
             "message": "Connected to search progress stream"
@@ -147,9 +200,9 @@ async def websocket_endpoint(websocket: WebSocket, task_id: str):
             
             # If task is already completed, send result immediately
             if task_info["status"] == "completed" and "result" in task_info:
-                await ws_manager.send_result(task_id, task_info["result"].model_dump())
+                ws_manager.send_result(task_id, task_info["result"])
             elif task_info["status"] == "failed":
-                await ws_manager.send_error(task_id, task_info.get("error", "Unknown error"))
+                ws_manager.send_error(task_id, task_info.get("error", "Unknown error"))
         
         # Keep connection alive
         while True:
@@ -158,7 +211,7 @@ async def websocket_endpoint(websocket: WebSocket, task_id: str):
                 message = await websocket.receive_text()
                 
                 # Echo back any client messages
-                await ws_manager.send_message(task_id, {
+                ws_manager.send_message(task_id, {
                     "type": "echo",
                     "message": message
                 })
@@ -174,7 +227,11 @@ async def websocket_endpoint(websocket: WebSocket, task_id: str):
         logger.error(f"WebSocket connection failed for task {task_id}: {e}", exc_info=True)
     finally:
         # Disconnect and cleanup
-        ws_manager.disconnect(task_id)
+        # Only what this connection registered; a reconnect may already own task_id
+        if writer:
+            ws_manager.stop_writer(task_id, writer)
+        if ws_manager.active_connections.get(task_id) is websocket:
+            del ws_manager.active_connections[task_id]
         
         # Clean up completed tasks after disconnect
         if task_id in active_tasks and active_tasks[task_id]["status"] in ["completed", "failed"]:
@@ -201,5 +258,9 @@ if __name__ == "__main__":
         app,
         host="0.0.0.0",
         port=port,
-        log_level="info"
+        log_level="info",
+        loop=UVICORN_LOOP,  # uvloop everywhere but Windows
+        http="auto",  # httptools when installed, h11 otherwise
+        ws="websockets",
+        ws_per_message_deflate=False  # Short JSON frames gain little from compression
     )
\ No newline at end of file
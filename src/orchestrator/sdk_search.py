@@ -74,7 +74,7 @@ async def execute_sdk_search(
             analysis=f"Search failed due to an error: {str(e)}",
             raw_data={"error": str(e)},
             tool_calls=[],
-            reasoning_trace=["Error occurred during search"]
+            reasoning_trace=[{"reasoning": "Error occurred during search"}]
         )
 
 
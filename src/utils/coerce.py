@@ -0,0 +1,41 @@
+# AIDEV-SECTION: Raw API Field Coercion
+"""
+Helpers for turning loosely typed fields from search APIs into Paper field values.
+Shared by BioResearcher and the SDK paper extractor so both parse results the same way.
+"""
+import re
+from datetime import datetime
+from typing import Any, Optional
+
+
+def as_str(value: Any) -> Optional[str]:
+    """Coerce a raw API field to str, keeping None"""
+    if value is None or isinstance(value, str):
+        return value
+    return str(value)
+
+
+_YEAR_RE = re.compile(r'\d{4}')
+
+
+def parse_year_date(date_value: Any) -> Optional[datetime]:
+    """Parse a year, ISO date or free-form date string to January 1st of its year"""
+    if not date_value:
+        return None
+    
+    try:
+        if isinstance(date_value, int):
+            # Year only
+            return datetime(date_value, 1, 1)
+        elif isinstance(date_value, str):
+            # ISO dates and bare years start with the year, no regex needed
+            if len(date_value) >= 4 and date_value[:4].isdigit():
+                return datetime(int(date_value[:4]), 1, 1)
+            # Try to extract year
+            year_match = _YEAR_RE.search(date_value)
+            if year_match:
+                return datetime(int(year_match.group()), 1, 1)
+    except (ValueError, OverflowError):
+        pass
+    
+    return None
@@ -0,0 +1,29 @@
+# AIDEV-SECTION: Event Loop Tuning
+"""
+Event loop tweaks applied once at application startup.
+"""
+import asyncio
+import logging
+import sys
+
+logger = logging.getLogger(__name__)
+
+# AIDEV-NOTE: Passed as uvicorn.run(loop=...). uvloop is required on POSIX (requirements.txt
+# pins it for every platform but Windows), so ask for it explicitly rather than rely on "auto"
+# silently falling back to the stdlib loop; uvloop does not support Windows
+UVICORN_LOOP = "auto" if sys.platform == "win32" else "uvloop"
+
+
+def enable_eager_tasks():
+    """Use asyncio's eager task factory on the running loop when available (Python 3.12+).
+
+    Eager tasks run synchronously until their first real suspension, so short coroutines
+    like progress callbacks finish without a trip through the ready queue.
+    """
+    # AIDEV-NOTE: runtime.txt pins Python 3.11, where this is a no-op
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is None:
+        logger.info("asyncio.eager_task_factory unavailable on this Python, using default task factory")
+        return
+    asyncio.get_running_loop().set_task_factory(eager_task_factory)
+    logger.info("Eager task factory enabled")
@@ -0,0 +1,39 @@
+# AIDEV-SECTION: Fast JSON helpers
+"""
+Thin wrapper around orjson with a stdlib json fallback.
+Both functions work with str so callers don't need to care which backend is active.
+Pydantic models are serialized through model_dump(); anything else unknown is coerced with str().
+"""
+
+try:
+    import orjson
+
+    def _default(obj):
+        # orjson serializes the datetimes inside the dump natively
+        if hasattr(obj, "model_dump"):
+            return obj.model_dump()
+        return str(obj)
+
+    def dumps(obj) -> str:
+        """Serialize to a JSON string, coercing unknown types with str()"""
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(data):
+        """Parse JSON from str or bytes"""
+        return orjson.loads(data)
+
+except ImportError:  # pragma: no cover - orjson is listed in requirements.txt
+    import json
+
+    def _default(obj):
+        if hasattr(obj, "model_dump"):
+            return obj.model_dump(mode="json")
+        return str(obj)
+
+    def dumps(obj) -> str:
+        """Serialize to a JSON string, coercing unknown types with str()"""
+        return json.dumps(obj, default=_default, ensure_ascii=False)
+
+    def loads(data):
+        """Parse JSON from str or bytes"""
+        return json.loads(data)
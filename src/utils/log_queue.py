@@ -0,0 +1,33 @@
+# AIDEV-SECTION: Non-blocking Logging
+"""
+Route root-logger records through a queue so handler I/O (stdout, files) runs on a
+background thread instead of the asyncio event loop thread.
+"""
+import atexit
+import logging
+import logging.handlers
+import queue
+
+_listener = None
+
+
+def setup_queue_logging():
+    """Move the root logger's handlers behind a QueueListener; safe to call more than once"""
+    global _listener
+    if _listener is not None:
+        return
+
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    if not handlers:
+        return
+
+    log_queue = queue.SimpleQueue()
+    for handler in handlers:
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    # Flush anything still queued on interpreter exit
+    atexit.register(_listener.stop)
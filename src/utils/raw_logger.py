@@ -3,28 +3,43 @@
 Simple raw logger for capturing all agent interactions
 """
 
-import json
 import os
 from datetime import datetime
 from pathlib import Path
 
-# Create logs directory
-LOG_DIR = Path("logs")
-LOG_DIR.mkdir(exist_ok=True)
+from src.utils import fast_json
+from src.utils.timestamps import local_timestamp
 
 # Log file with timestamp
+LOG_DIR = Path("logs")
 LOG_FILE = LOG_DIR / f"raw_agent_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
 
+# AIDEV-NOTE: The logs directory and LOG_INIT entry are created on the first write, so importing
+# an agent module (tests, one-off scripts) has no filesystem side effects
+_log_initialized = False
+
+def _init_log_file():
+    """Create the logs directory and record the start of the log"""
+    global _log_initialized
+    _log_initialized = True
+    LOG_DIR.mkdir(exist_ok=True)
+    log_raw({
+        "type": "LOG_INIT",
+        "message": f"Raw logging initialized. Log file: {LOG_FILE}"
+    })
+    print(f"Raw logging enabled: {LOG_FILE}")
+
 def log_raw(data):
     """Write raw log entry"""
     try:
+        if not _log_initialized:
+            _init_log_file()
         with open(LOG_FILE, 'a', encoding='utf-8') as f:
             entry = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": local_timestamp(),
                 **data
             }
-            json.dump(entry, f, ensure_ascii=False, default=str)
-            f.write('\n')
+            f.write(fast_json.dumps(entry) + '\n')
     except Exception as e:
         print(f"Logging error: {e}")
 
@@ -59,6 +74,16 @@ def log_openai_request(agent, model, messages, tools=None):
 
 def log_openai_response(agent, model, response):
     """Log Azure OpenAI API response"""
+    if hasattr(response, 'choices') and response.choices:
+        choice = response.choices[0]
+        message, finish_reason = choice.message, choice.finish_reason
+    else:
+        message, finish_reason = None, None
+    
+    log_openai_message(agent, model, message, finish_reason, getattr(response, 'usage', None))
+
+def log_openai_message(agent, model, message, finish_reason=None, usage=None):
+    """Log an assistant message, e.g. one assembled from a streamed response"""
     data = {
         "type": "OPENAI_RESPONSE",
         "agent": agent,
@@ -66,14 +91,13 @@ def log_openai_response(agent, model, response):
     }
     
     # Extract response details
-    if hasattr(response, 'choices') and response.choices:
-        choice = response.choices[0]
-        data["finish_reason"] = choice.finish_reason
-        data["content"] = choice.message.content if choice.message.content else None
+    if message is not None:
+        data["finish_reason"] = finish_reason
+        data["content"] = message.content if message.content else None
         data["tool_calls"] = []
         
-        if hasattr(choice.message, 'tool_calls') and choice.message.tool_calls:
-            for tc in choice.message.tool_calls:
+        if hasattr(message, 'tool_calls') and message.tool_calls:
+            for tc in message.tool_calls:
                 data["tool_calls"].append({
                     "id": tc.id,
                     "function": tc.function.name,
@@ -81,19 +105,11 @@ def log_openai_response(agent, model, response):
                 })
     
     # Add usage if available
-    if hasattr(response, 'usage'):
+    if usage:
         data["usage"] = {
-            "prompt_tokens": response.usage.prompt_tokens,
-            "completion_tokens": response.usage.completion_tokens,
-            "total_tokens": response.usage.total_tokens
+            "prompt_tokens": usage.prompt_tokens,
+            "completion_tokens": usage.completion_tokens,
+            "total_tokens": usage.total_tokens
         }
     
-    log_raw(data)
-
-# Log initialization
-log_raw({
-    "type": "LOG_INIT",
-    "message": f"Raw logging initialized. Log file: {LOG_FILE}"
-})
-
-print(f"Raw logging enabled: {LOG_FILE}")
\ No newline at end of file
+    log_raw(data)
\ No newline at end of file
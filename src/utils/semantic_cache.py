@@ -0,0 +1,167 @@
+# AIDEV-SECTION: Semantic Query Cache
+"""
+Cache of completed search results keyed by query meaning rather than exact text.
+Uses a sentence-transformers embedding and an hnswlib cosine index when those
+packages are installed; otherwise falls back to exact matching on the normalized query.
+"""
+import asyncio
+import logging
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import hnswlib
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_CACHE_AVAILABLE = True
+except ImportError:
+    SEMANTIC_CACHE_AVAILABLE = False
+
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+EMBEDDING_DIM = 384
+SIMILARITY_THRESHOLD = 0.92
+# Results hold full paper lists and raw searches; least recently used entries are evicted beyond this
+MAX_ENTRIES = 128
+# Literature moves on - entries older than this are treated as missing
+DEFAULT_TTL_SECONDS = 6 * 60 * 60
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_TOKEN_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9\-]*")
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase and collapse whitespace so trivial variants share a key"""
+    return _WHITESPACE_RE.sub(" ", query.strip().lower())
+
+
+def entity_tokens(query: str) -> FrozenSet[str]:
+    """Tokens that name specific things - anything with a digit (BRCA1, IL-6, 2019) or an
+    acronym/gene symbol (KRAS, EGFR) - lowercased for comparison"""
+    return frozenset(
+        token.lower() for token in _TOKEN_RE.findall(query)
+        if any(c.isdigit() for c in token) or sum(c.isupper() for c in token) >= 2
+    )
+
+
+class SemanticCache:
+    """Stores values by query; a lookup hits on any prior query with cosine similarity >= threshold
+    that names exactly the same entities. Holds at most max_entries values for up to ttl seconds,
+    evicting the least recently used."""
+
+    def __init__(self, threshold: float = SIMILARITY_THRESHOLD, max_elements: int = 10000,
+                 max_entries: int = MAX_ENTRIES, ttl: float = DEFAULT_TTL_SECONDS):
+        self.threshold = threshold
+        self.max_elements = max_elements
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # entry id -> (value, expiry on the monotonic clock)
+        self._entries: "OrderedDict[int, Tuple[Any, float]]" = OrderedDict()
+        self._ids_by_query: Dict[str, int] = {}
+        self._query_by_id: Dict[int, str] = {}
+        self._entities_by_id: Dict[int, FrozenSet[str]] = {}
+        self._pending_embeddings: Dict[str, Any] = {}
+        self._next_id = 0
+        self._embedder = None
+        self._index = None
+
+        if SEMANTIC_CACHE_AVAILABLE:
+            self._index = hnswlib.Index(space="cosine", dim=EMBEDDING_DIM)
+            # Evicted entries are marked deleted and their slots reused
+            self._index.init_index(max_elements=max_elements, ef_construction=200, M=16, allow_replace_deleted=True)
+        else:
+            logger.info("sentence-transformers/hnswlib not installed; semantic cache uses exact query matching")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _encode(self, query: str):
+        # AIDEV-NOTE: Model is loaded on first use so SearchAgent construction stays fast
+        if self._embedder is None:
+            self._embedder = SentenceTransformer(EMBEDDING_MODEL)
+        return self._embedder.encode([query], normalize_embeddings=True)[0]
+
+    async def get(self, query: str) -> Optional[Any]:
+        """Return the cached value for query or a semantically equivalent one"""
+        key = normalize_query(query)
+        entry_id = self._ids_by_query.get(key)
+        if entry_id is not None:
+            return self._touch(entry_id)
+
+        if self._index is None:
+            return None
+
+        # Encoding is CPU-bound, keep it off the event loop
+        embedding = await asyncio.to_thread(self._encode, key)
+        if len(self._pending_embeddings) >= 1000:
+            # Searches that failed never call put(); don't let their embeddings pile up
+            self._pending_embeddings.clear()
+        self._pending_embeddings[key] = embedding
+        # AIDEV-NOTE: hnswlib's element count includes mark_deleted entries, so it can't tell
+        # whether anything live is left - the entries dict can
+        if not self._entries:
+            return None
+
+        try:
+            labels, distances = self._index.knn_query(embedding, k=1)
+        except RuntimeError as e:
+            # Raised when fewer than k undeleted elements remain; a lookup failure is just a miss
+            logger.debug(f"Semantic cache lookup failed for '{query}': {e}")
+            return None
+        similarity = 1.0 - float(distances[0][0])
+        if similarity < self.threshold:
+            return None
+        entry_id = int(labels[0][0])
+        # AIDEV-NOTE: Embeddings barely separate "BRCA1" from "BRCA2"; a paraphrase only counts
+        # when it names exactly the same entities, otherwise only exact matches hit
+        if self._entities_by_id.get(entry_id) != entity_tokens(query):
+            return None
+        logger.info(f"Semantic cache hit for '{query}' (similarity {similarity:.3f})")
+        return self._touch(entry_id)
+
+    def _touch(self, entry_id: int) -> Optional[Any]:
+        """Return an entry's value, marking it most recently used; expired entries are dropped"""
+        entry = self._entries.get(entry_id)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            self._remove(entry_id)
+            return None
+        self._entries.move_to_end(entry_id)
+        return value
+
+    def _remove(self, entry_id: int) -> None:
+        del self._entries[entry_id]
+        del self._ids_by_query[self._query_by_id.pop(entry_id)]
+        del self._entities_by_id[entry_id]
+        if self._index is not None:
+            self._index.mark_deleted(entry_id)
+
+    def _evict(self) -> None:
+        """Drop least recently used entries beyond max_entries"""
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    async def put(self, query: str, value: Any) -> None:
+        """Store value for query, reusing the embedding computed by get() if any"""
+        key = normalize_query(query)
+        entry_id = self._ids_by_query.get(key)
+        if entry_id is None:
+            entry_id = self._next_id
+            self._next_id += 1
+            if self._index is not None:
+                embedding = self._pending_embeddings.pop(key, None)
+                if embedding is None:
+                    embedding = await asyncio.to_thread(self._encode, key)
+                if self._index.get_current_count() >= self._index.get_max_elements():
+                    self._index.resize_index(self._index.get_max_elements() * 2)
+                self._index.add_items([embedding], [entry_id], replace_deleted=True)
+            self._ids_by_query[key] = entry_id
+            self._query_by_id[entry_id] = key
+            self._entities_by_id[entry_id] = entity_tokens(query)
+        self._entries[entry_id] = (value, time.monotonic() + self.ttl)
+        self._entries.move_to_end(entry_id)
+        self._evict()
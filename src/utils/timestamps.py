@@ -0,0 +1,29 @@
+# AIDEV-SECTION: Cached ISO-8601 Timestamps
+"""
+ISO-8601 timestamps with microseconds for hot paths (WebSocket envelopes, raw log entries).
+The "YYYY-MM-DDTHH:MM:SS" part is only reformatted once per second, so each call costs
+a clock read and one f-string instead of a datetime object and isoformat().
+"""
+import time
+
+
+def _second_cached(to_struct_time):
+    """Build a timestamp function for time.gmtime (UTC) or time.localtime (local time)"""
+    cached_second = None
+    cached_prefix = ""
+
+    def timestamp() -> str:
+        nonlocal cached_second, cached_prefix
+        second, micros = divmod(time.time_ns() // 1000, 1_000_000)
+        if second != cached_second:
+            cached_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", to_struct_time(second))
+            cached_second = second
+        return f"{cached_prefix}.{micros:06d}"
+
+    return timestamp
+
+
+# UTC, for message envelopes the frontend parses
+utc_timestamp = _second_cached(time.gmtime)
+# Local time, matching datetime.now().isoformat() in the raw agent logs
+local_timestamp = _second_cached(time.localtime)
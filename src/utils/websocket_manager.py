@@ -1,17 +1,24 @@
 # AIDEV-SECTION: WebSocket Connection Manager
 import asyncio
 import logging
-from typing import Dict, Set
-from datetime import datetime
+from typing import Dict, Optional, Set
 from fastapi import WebSocket
 from starlette.websockets import WebSocketState
 
+from src.utils import fast_json
+from src.utils.timestamps import utc_timestamp  # Re-exported for the orchestrators
+
 logger = logging.getLogger(__name__)
 
+# Backlog beyond which droppable messages (progress updates) are discarded instead of queued
+SEND_QUEUE_LIMIT = 256
+
 class ConnectionManager:
     def __init__(self):
         self.active_connections: Dict[str, WebSocket] = {}
         self.heartbeat_tasks: Dict[str, asyncio.Task] = {}
+        self.send_queues: Dict[str, asyncio.Queue] = {}
+        self.writer_tasks: Dict[str, asyncio.Task] = {}
         
     async def connect(self, websocket: WebSocket, task_id: str):
         """Accept WebSocket connection and start heartbeat"""
@@ -49,17 +56,103 @@ class ConnectionManager:
     
     async def send_json(self, task_id: str, data: dict):
         """Send JSON data to specific connection"""
+        return await self.send_text(task_id, fast_json.dumps(data))
+    
+    async def send_text(self, task_id: str, text: str):
+        """Send an already serialized JSON message to specific connection"""
         if task_id in self.active_connections:
             websocket = self.active_connections[task_id]
             if websocket.client_state == WebSocketState.CONNECTED:
                 try:
-                    await websocket.send_json(data)
+                    await websocket.send_text(text)
                     return True
                 except Exception as e:
                     logger.error(f"Error sending to {task_id}: {e}")
                     await self.disconnect(task_id)
         return False
     
+    # AIDEV-NOTE: With a writer running, producers only enqueue - a slow client backs up its
+    # own queue instead of stalling the agent coroutines that report progress
+    def start_writer(self, task_id: str, websocket: WebSocket) -> asyncio.Task:
+        """Route outgoing messages for task_id through a queue drained by one writer task.
+        Replaces any writer already running for task_id; returns the handle for stop_writer."""
+        self.stop_writer(task_id)
+        queue = asyncio.Queue()
+        writer = asyncio.create_task(self._writer_loop(websocket, task_id, queue))
+        self.send_queues[task_id] = queue
+        self.writer_tasks[task_id] = writer
+        return writer
+    
+    def stop_writer(self, task_id: str, writer: Optional[asyncio.Task] = None):
+        """Cancel the writer for task_id, discarding anything still queued.
+        Given the handle from start_writer, a newer writer for the same task_id is left alone."""
+        current = self.writer_tasks.get(task_id)
+        if writer is None:
+            writer = current
+        if writer is not None and writer is current:
+            del self.writer_tasks[task_id]
+            self.send_queues.pop(task_id, None)
+        if writer:
+            writer.cancel()
+    
+    def enqueue(self, task_id: str, text: str, droppable: bool = False) -> bool:
+        """Queue a serialized message for the writer without waiting on the socket.
+        Droppable messages are discarded once SEND_QUEUE_LIMIT messages are backed up."""
+        queue = self.send_queues.get(task_id)
+        if queue is None:
+            return False
+        if droppable and queue.qsize() >= SEND_QUEUE_LIMIT:
+            return False
+        queue.put_nowait(text)
+        return True
+    
+    # AIDEV-NOTE: Typed helpers for the SDK orchestrator; like enqueue they never await, so
+    # a burst of progress events costs one queue put each
+    def send_message(self, task_id: str, message: dict) -> bool:
+        """Queue a JSON message for the connection's writer"""
+        return self.enqueue(task_id, fast_json.dumps(message))
+    
+    def send_progress(self, task_id: str, data: dict) -> bool:
+        """Queue a progress update; dropped under backlog since the next one supersedes it"""
+        return self.enqueue(task_id, fast_json.dumps({
+            "type": "progress",
+            "data": data,
+            "timestamp": utc_timestamp()
+        }), droppable=True)
+    
+    def send_result(self, task_id: str, result) -> bool:
+        """Queue the final result (a dict or Pydantic model)"""
+        return self.send_message(task_id, {
+            "type": "result",
+            "data": result,
+            "timestamp": utc_timestamp()
+        })
+    
+    def send_error(self, task_id: str, error: str) -> bool:
+        """Queue an error message"""
+        return self.send_message(task_id, {
+            "type": "error",
+            "data": {"error": error},
+            "timestamp": utc_timestamp()
+        })
+    
+    async def _writer_loop(self, websocket: WebSocket, task_id: str, queue: asyncio.Queue):
+        """Send queued messages in order until cancelled or the socket fails"""
+        try:
+            while True:
+                text = await queue.get()
+                await websocket.send_text(text)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            # AIDEV-NOTE: The connection is dead - unregister the queue so enqueue rejects
+            # further messages instead of piling them up until the receive loop cleans up.
+            # Only if it is still ours; a reconnect may already have started a new writer
+            logger.error(f"Error sending to {task_id}: {e}")
+            if self.send_queues.get(task_id) is queue:
+                del self.send_queues[task_id]
+                self.writer_tasks.pop(task_id, None)
+    
     async def _heartbeat_loop(self, websocket: WebSocket, task_id: str):
         """Send periodic heartbeats"""
         try:
@@ -71,7 +164,7 @@ class ConnectionManager:
                     
                 success = await self.send_json(task_id, {
                     "type": "heartbeat",
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": utc_timestamp()
                 })
                 
                 if not success:
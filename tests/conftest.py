@@ -0,0 +1,10 @@
+# AIDEV-SECTION: Test Setup
+"""Make the repository root importable and satisfy the agents' required settings."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Agent constructors refuse to start without these; no test talks to Azure
+os.environ.setdefault("ENDPOINT_URL", "https://example.invalid/")
+os.environ.setdefault("AZURE_OPENAI_API_KEY", "test-key")
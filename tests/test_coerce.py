@@ -0,0 +1,31 @@
+"""Raw API field coercion helpers."""
+from datetime import datetime
+
+from src.utils.coerce import as_str, parse_year_date
+
+
+def test_parse_year_date_leading_year():
+    assert parse_year_date("2019-05-01") == datetime(2019, 1, 1)
+    assert parse_year_date("2021") == datetime(2021, 1, 1)
+    assert parse_year_date(2020) == datetime(2020, 1, 1)
+
+
+def test_parse_year_date_year_inside_text():
+    assert parse_year_date("c. 1999") == datetime(1999, 1, 1)
+
+
+def test_parse_year_date_short_numeric_string_is_not_a_year():
+    assert parse_year_date("19") is None
+    assert parse_year_date("123") is None
+
+
+def test_parse_year_date_missing_or_unparseable():
+    assert parse_year_date(None) is None
+    assert parse_year_date("") is None
+    assert parse_year_date("n/a") is None
+
+
+def test_as_str_keeps_none_and_strings():
+    assert as_str(None) is None
+    assert as_str("x") == "x"
+    assert as_str(12) == "12"
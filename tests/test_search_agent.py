@@ -0,0 +1,63 @@
+"""SearchAgent.execute result assembly."""
+import asyncio
+from collections import OrderedDict
+
+from src.agents.search_agent import SearchAgent
+from src.models.paper import Paper
+from src.utils import raw_logger
+from src.utils.semantic_cache import SemanticCache
+
+
+def _research(tag):
+    """A BioResearcher.search result whose tool calls point into raw_searches by response_key,
+    with keys shaped like BioResearcher's (same tool and round in both research runs)"""
+    response_key = f"search_pubmed_0_call_{tag}"
+    return {
+        "papers": [Paper(title=f"Paper {tag}", abstract="", authors=[], hyperlink="", source="PubMed")],
+        "tool_calls": [{"tool": "search_pubmed", "arguments": {"query": tag}, "round": 0, "response_key": response_key}],
+        "raw_searches": {response_key: {"results": [{"title": f"Paper {tag}"}]}},
+        "reasoning_trace": [],
+        "researcher_output": f"output {tag}",
+        "analysis": "",
+    }
+
+
+class FakeResearcher:
+    async def search(self, query):
+        return _research("initial")
+
+    async def search_specific(self, missing_info):
+        return _research("additional")
+
+
+class FakeAnalyser:
+    async def analyze(self, query, research_data):
+        return {"satisfied": False, "analysis": "partial", "missing_info": "clinical outcomes"}
+
+    async def analyze_with_cache(self, cache_data):
+        return {"satisfied": True, "analysis": "complete"}
+
+
+class FakeSummarizer:
+    async def summarize(self, **kwargs):
+        return "summary"
+
+
+def _search_agent():
+    agent = SearchAgent.__new__(SearchAgent)
+    agent.researcher, agent.analyser, agent.summarizer = FakeResearcher(), FakeAnalyser(), FakeSummarizer()
+    agent.cache = OrderedDict()
+    agent.result_cache = SemanticCache()
+    return agent
+
+
+def test_every_tool_call_response_key_resolves(monkeypatch, tmp_path):
+    monkeypatch.setattr(raw_logger, "LOG_DIR", tmp_path)
+    monkeypatch.setattr(raw_logger, "LOG_FILE", tmp_path / "raw_agent_log.json")
+    monkeypatch.setattr(raw_logger, "_log_initialized", False)
+    result = asyncio.run(_search_agent().execute("BRCA1 penetrance"))
+
+    raw_searches = result.raw_data["raw_searches"]
+    assert len(result.tool_calls) == 2
+    for tool_call in result.tool_calls:
+        assert tool_call["response_key"] in raw_searches
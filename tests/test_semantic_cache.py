@@ -0,0 +1,81 @@
+"""SemanticCache lookups after entries leave the index."""
+import asyncio
+
+from src.utils import semantic_cache
+from src.utils.semantic_cache import SemanticCache
+
+
+class FakeIndex:
+    """Mimics the hnswlib behaviour that matters here: mark_deleted entries still count
+    towards get_current_count(), and knn_query raises once fewer than k live entries remain."""
+
+    def __init__(self, space, dim):
+        self.vectors = {}
+        self.deleted = set()
+
+    def init_index(self, max_elements, **kwargs):
+        self.max_elements = max_elements
+
+    def get_current_count(self):
+        return len(self.vectors)
+
+    def get_max_elements(self):
+        return self.max_elements
+
+    def add_items(self, embeddings, ids, replace_deleted=False):
+        for embedding, entry_id in zip(embeddings, ids):
+            self.vectors[entry_id] = embedding
+            self.deleted.discard(entry_id)
+
+    def mark_deleted(self, entry_id):
+        self.deleted.add(entry_id)
+
+    def knn_query(self, embedding, k=1):
+        live = [entry_id for entry_id in self.vectors if entry_id not in self.deleted]
+        if len(live) < k:
+            raise RuntimeError("Cannot return the results in a contiguous 2D array. "
+                               "Probably ef or M is too small")
+        return [live[:k]], [[0.0] * k]
+
+
+def _semantic_cache(monkeypatch, **kwargs):
+    monkeypatch.setattr(semantic_cache, "SEMANTIC_CACHE_AVAILABLE", True)
+    monkeypatch.setattr(semantic_cache, "hnswlib", type("hnswlib", (), {"Index": FakeIndex}), raising=False)
+    cache = SemanticCache(**kwargs)
+    monkeypatch.setattr(cache, "_encode", lambda query: [1.0])
+    return cache
+
+
+def test_get_after_eviction_is_a_miss(monkeypatch):
+    cache = _semantic_cache(monkeypatch, max_entries=1)
+
+    async def scenario():
+        await cache.put("BRCA1 breast cancer risk", "first")
+        await cache.put("TP53 mutations in glioma", "second")  # evicts the first entry
+        assert await cache.get("breast cancer risk of BRCA1") is None
+        cache._remove(next(iter(cache._entries)))  # nothing live left, both still counted
+        assert cache._index.get_current_count() == 2
+        return await cache.get("TP53 mutations in glioma tumours")
+
+    assert asyncio.run(scenario()) is None
+
+
+def test_get_after_expiry_is_a_miss(monkeypatch):
+    cache = _semantic_cache(monkeypatch, ttl=0)
+
+    async def scenario():
+        await cache.put("KRAS inhibitors", "value")
+        assert await cache.get("kras  inhibitors") is None  # exact hit, expired and removed
+        return await cache.get("KRAS inhibitor trials")
+
+    assert asyncio.run(scenario()) is None
+
+
+def test_paraphrase_hits_only_with_matching_entities(monkeypatch):
+    cache = _semantic_cache(monkeypatch)
+
+    async def scenario():
+        await cache.put("BRCA1 breast cancer risk", "brca1")
+        return await cache.get("breast cancer risk of BRCA1"), await cache.get("BRCA2 breast cancer risk")
+
+    assert asyncio.run(scenario()) == ("brca1", None)
@@ -0,0 +1,44 @@
+import asyncio
+
+from src.utils.websocket_manager import ConnectionManager
+
+
+class BrokenSocket:
+    """Stands in for a WebSocket whose peer has gone away"""
+    
+    async def send_text(self, text):
+        raise RuntimeError("socket closed")
+
+
+def test_enqueue_rejected_after_writer_fails():
+    async def run():
+        manager = ConnectionManager()
+        writer = manager.start_writer("t1", BrokenSocket())
+        assert manager.enqueue("t1", "first")
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert writer.done()
+        assert "t1" not in manager.send_queues
+        assert not manager.enqueue("t1", "second")
+        manager.stop_writer("t1", writer)
+    
+    asyncio.run(run())
+
+
+def test_failed_writer_leaves_newer_writer_alone():
+    async def run():
+        manager = ConnectionManager()
+        old_writer = manager.start_writer("t1", BrokenSocket())
+        manager.enqueue("t1", "first")
+        # Reconnect before the old writer notices its socket is gone
+        new_writer = asyncio.create_task(asyncio.sleep(10))
+        manager.send_queues["t1"] = new_queue = asyncio.Queue()
+        manager.writer_tasks["t1"] = new_writer
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert old_writer.done()
+        assert manager.send_queues["t1"] is new_queue
+        assert manager.writer_tasks["t1"] is new_writer
+        new_writer.cancel()
+    
+    asyncio.run(run())